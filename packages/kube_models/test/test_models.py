@@ -1,6 +1,6 @@
 import copy
 from unittest import TestCase
-from typing import Type, cast
+from typing import Type, Optional, cast
 from dataclasses import dataclass, field
 
 from kube_models import get_k8s_resource_model, K8sResource, Loadable
@@ -9,6 +9,19 @@ from kube_models.api_v1.io.k8s.api.core.v1 import Secret, Namespace
 from kube_models.apis_apps_v1.io.k8s.api.apps.v1 import Deployment
 
 
+@dataclass(kw_only=True, frozen=True, slots=True)
+class _ScalarRef(Loadable):
+    name: str
+    uid: Optional[str] = None
+    controller: bool | None = None
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class _RefHolder(Loadable):
+    ref: _ScalarRef
+    refs: list[_ScalarRef] = field(default_factory=list)
+
+
 class UtilsTest(TestCase):
     def test_model_by_kind_core(self):
         secret = cast(Type[Secret], get_k8s_resource_model('v1', 'Secret'))
@@ -77,3 +90,13 @@ class UtilsTest(TestCase):
         }
         res = MyCustomResource.from_dict(resource_src)
         self.assertEqual("2", res.spec.some_field[1].value)
+
+    def test_deepcopy_shares_immutable_models(self):
+        holder = _RefHolder.from_dict({"ref": {"name": "a"}, "refs": [{"name": "b", "controller": True}]})
+        self.assertIs(holder.ref, copy.deepcopy(holder.ref))
+
+        copied = copy.deepcopy(holder)
+        self.assertIsNot(holder, copied)
+        self.assertIsNot(holder.refs, copied.refs)
+        self.assertIs(holder.ref, copied.ref)
+        self.assertEqual(holder, copied)
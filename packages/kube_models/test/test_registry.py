@@ -83,6 +83,19 @@ class TestRegistry(unittest.TestCase):
         register_model(SecondRegistered)
         self.assertIs(FirstRegistered, get_model("v1", "ConfigMap"))
 
+    def test_register_model_replaced_by_slots_rebuild(self) -> None:
+        class CustomResource:
+            apiVersion = "example.com/v1"
+            kind = "Custom"
+
+        # The metaclass registers the class before @dataclass(slots=True) builds the final one
+        register_model(CustomResource)
+        rebuilt = dataclass(slots=True)(CustomResource)
+        self.assertIsNot(rebuilt, CustomResource)
+
+        register_model(rebuilt)
+        self.assertIs(rebuilt, get_model("example.com/v1", "Custom"))
+
     def test_get_model_by_body_validation(self) -> None:
         class BodyModel:
             apiVersion = "v1"
@@ -18,15 +18,17 @@ logger = logging.getLogger(__name__)
 
 
 from ._path.picker import PathPicker, PathRoot, path_, from_root_
-from ._path.replace_at_path import replace_
+from ._path.replace_at_path import replace_, replace_many_
 from ._patch.json_patch import guard_lists_from_json_patch_replacement, apply_patch, json_patch_from_diff
 from ._patch.strategic_merge_patch import jsonpatch_to_smp
 
+from .common import gather_bounded
 from .login import login, KubeConfig
 from .credentials import ServerInfo, ClientInfo, ConnectionInfo
 
 from .errors import *
 from .client import APIRequestProcessingConfig, APIRequestLoggingConfig, DryRun, PropagationPolicy, LabelSelectorOp, \
     QueryLabelSelectorRequirement, QueryLabelSelector, FieldSelectorOp, FieldSelectorRequirement, FieldSelector, \
-    K8sQueryParams, K8sAPIRequestLoggingConfig, get_k8s_resource, create_k8s_resource, update_k8s_resource, \
-    delete_k8s_resource, create_or_update_k8s_resource, WatchEventType, K8sResourceEvent, watch_k8s_resources
+    K8sQueryParams, K8sAPIRequestLoggingConfig, get_k8s_resource, iter_k8s_resources, count_k8s_resources, \
+    create_k8s_resource, update_k8s_resource, delete_k8s_resource, create_or_update_k8s_resource, apply_k8s_resource, \
+    scale_k8s_resource, WatchEventType, K8sResourceEvent, watch_k8s_resources
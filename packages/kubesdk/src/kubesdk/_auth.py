@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-import json
-import string
 import secrets
 import base64
 import functools
+import itertools
 import os
 import ssl
 import threading
@@ -15,7 +14,7 @@ from typing import Any, Callable, Generic, TypeVar, cast, Awaitable, AsyncIterab
 
 import aiohttp
 
-from .common import host_from_url
+from .common import host_from_url, json_dumps
 from .errors import *
 from .credentials import Vault, ConnectionInfo, LoginError
 from ._temp_files import _TempFiles
@@ -23,9 +22,14 @@ from ._temp_files import _TempFiles
 
 T = TypeVar("T")
 DEFAULT_VAULT_NAME = "default"
-POOL_SIZE = int(os.getenv("KUBESDK_CLIENT_POOL_SIZE", 2))
+POOL_SIZE = int(os.getenv("KUBESDK_CLIENT_POOL_SIZE", 1))
 THREADS = int(os.getenv("KUBESDK_CLIENT_THREADS", 2))
 MAX_STREAMS_PER_LOOP = int(os.getenv("KUBESDK_MAX_STREAMS_PER_LOOP", 25))
+MAX_CONNECTIONS_PER_SESSION = int(os.getenv("KUBESDK_MAX_CONNECTIONS_PER_SESSION", 100))
+KEEPALIVE_TIMEOUT = int(os.getenv("KUBESDK_KEEPALIVE_TIMEOUT", 120))
+
+
+_UNSET = object()
 
 
 class GlobalContextVar(Generic[T]):
@@ -50,13 +54,14 @@ class GlobalContextVar(Generic[T]):
         return token
 
     def get(self) -> T:
-        try:
-            return self._local.get()
-        except LookupError:
-            if self._has_global:
-                # Safe to cast because we only set via .set
-                return cast(T, self._global_value)
-            raise
+        # A default instead of catching LookupError: no exception on the common path
+        value = self._local.get(_UNSET)
+        if value is not _UNSET:
+            return value
+        if self._has_global:
+            # Safe to cast because we only set via .set
+            return cast(T, self._global_value)
+        raise LookupError(self._local)
 
     def reset(self, token) -> None:
         self._local.reset(token)
@@ -70,6 +75,24 @@ _auth_vault_var: GlobalContextVar[dict[str, Vault]] = GlobalContextVar("_auth_va
 _F = TypeVar("_F", bound=Callable[..., Any])
 
 
+@functools.lru_cache(maxsize=256)
+def _vault_key_by_origin(origin: str) -> str:
+    return host_from_url(origin) or DEFAULT_VAULT_NAME
+
+
+def _vault_key(url: str | None) -> str:
+    """
+    Vault key of the cluster the URL points to. Paths without a host go to the default vault.
+    Only the scheme://host[:port] part is parsed, once per origin, since it's the same for every request to a cluster.
+    """
+    if not url or (url[0] == "/" and url[:2] != "//"):
+        return DEFAULT_VAULT_NAME
+    scheme_end = url.find("://")
+    host_start = scheme_end + 3 if scheme_end >= 0 else 2 if url[:2] == "//" else 0
+    path_start = url.find("/", host_start)
+    return _vault_key_by_origin(url if path_start < 0 else url[:path_start])
+
+
 def authenticated(fn: _F) -> _F:
     """
     A decorator to inject a pre-authenticated session to a requesting routine.
@@ -98,7 +121,7 @@ def authenticated(fn: _F) -> _F:
                 yield item
             return
 
-        vault_key = host_from_url(kwargs.get("url")) or DEFAULT_VAULT_NAME
+        vault_key = _vault_key(kwargs.get("url"))
         vaults = _auth_vault_var.get()
         vault = vaults.get(vault_key)
         if vault is None:
@@ -131,11 +154,27 @@ def authenticated(fn: _F) -> _F:
         if explicit_context is not None:
             return await explicit_context.call(fn, *args, **kwargs)
 
-        vault_key = host_from_url(kwargs.get("url")) or DEFAULT_VAULT_NAME
+        vault_key = _vault_key(kwargs.get("url"))
         vaults = _auth_vault_var.get()
         vault = vaults.get(vault_key)
+        purpose = f"context-{session_key}"
+
+        # Steady state: use the already created context with no async iteration and locking over the vault.
+        # On failure, the item is invalidated the same way as below, and the regular path takes over.
+        cached = vault.cached(purpose)
+        if cached is not None:
+            key, info, context = cached
+            try:
+                return await context.call(fn, *args, **kwargs)
+            except UnauthorizedError as e:
+                await vault.invalidate(key, info, exc=e)
+            except RuntimeError as e:
+                if not context.closed:
+                    raise
+                await vault.invalidate(key, info, exc=e)
+
         forbidden_err = None
-        async for key, info, context in vault.extended(APIContext, f"context-{session_key}"):
+        async for key, info, context in vault.extended(APIContext, purpose):
             try:
                 return await context.call(fn, *args, **kwargs)
             except UnauthorizedError as e:
@@ -159,6 +198,40 @@ def authenticated(fn: _F) -> _F:
     return cast(_F, gen_wrapper) if is_generator else cast(_F, wrapper)
 
 
+def _file_stamp(path: str | None) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path) if path else None
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size) if stat else None
+
+
+def _ssl_context(ca_path: str | None, client_cert_path: str | None, client_key_path: str | None,
+                 insecure: bool) -> ssl.SSLContext:
+    """
+    SSL context for the given CA and client certificate files.
+    Re-logins to the same cluster reuse the context instead of parsing the CA store and PEM files again.
+    The file stamps are part of the cache key, so certificates rotated in place are picked up.
+    """
+    return _cached_ssl_context(ca_path, client_cert_path, client_key_path, insecure,
+                               _file_stamp(ca_path), _file_stamp(client_cert_path), _file_stamp(client_key_path))
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_ssl_context(ca_path: str | None, client_cert_path: str | None, client_key_path: str | None,
+                        insecure: bool, *_file_stamps: tuple[int, int] | None) -> ssl.SSLContext:
+    if client_cert_path and client_key_path:
+        ssl_context = ssl.create_default_context(purpose=ssl.Purpose.SERVER_AUTH, cafile=ca_path)
+        ssl_context.load_cert_chain(certfile=client_cert_path, keyfile=client_key_path)
+    else:
+        ssl_context = ssl.create_default_context(cafile=ca_path)
+
+    if insecure:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
 class _Worker:
     """
     A worker owns an asyncio event loop and a list of sessions created on that loop.
@@ -195,9 +268,11 @@ class _Worker:
                 if asyncio.iscoroutine(session):
                     session = await session
                 self._sessions.append(session)
-            self._ready.set()
 
         self._loop.run_until_complete(_init())
+        # Signal readiness from inside run_forever(): a stop() requested during the last iteration
+        # of run_until_complete() would be reset by it and lost, leaving the loop running until join() times out
+        self._loop.call_soon(self._ready.set)
         try:
             self._loop.run_forever()
         finally:
@@ -205,28 +280,30 @@ class _Worker:
             self._loop.close()
 
     async def _close_sessions(self) -> None:
+        # Close sessions concurrently, so their connections shut down in parallel
+        async_closes = []
         for s in self._sessions:
             close = getattr(s, "close", None)
             if asyncio.iscoroutinefunction(close):
-                try:
-                    await close()
-                except BaseException:
-                    pass
+                async_closes.append(close())
             elif callable(close):
                 try:
                     close()
                 except BaseException:
                     pass
+        if async_closes:
+            await asyncio.gather(*async_closes, return_exceptions=True)
         self._sessions.clear()
 
     def run_coroutine(self, coro: Awaitable[Any]):
         return asyncio.run_coroutine_threadsafe(coro, self._loop)
 
-    def stop(self) -> None:
+    def stop(self, wait: bool = True) -> None:
         if not self._closing.is_set():
             self._closing.set()
             def _stop(loop): loop.stop()
             self._loop.call_soon_threadsafe(_stop, self._loop)
+        if wait:
             self._thread.join(timeout=5)
 
 
@@ -253,8 +330,7 @@ class APIContext:
         self.pool_size = pool_size
         self.threads = threads
 
-        rand_string = ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(32))
-        tempfiles = _TempFiles(f"_{rand_string}")
+        tempfiles = _TempFiles(f"_{secrets.token_hex(16)}")
 
         ca_path = None
         client_cert_path = None
@@ -288,16 +364,8 @@ class APIContext:
         elif client_key_data_cfg:
             client_key_path = tempfiles[base64.b64decode(client_key_data_cfg)]
 
-        # Build SSL context
-        if client_cert_path and client_key_path:
-            ssl_context = ssl.create_default_context(purpose=ssl.Purpose.SERVER_AUTH, cafile=ca_path)
-            ssl_context.load_cert_chain(certfile=client_cert_path, keyfile=client_key_path)
-        else:
-            ssl_context = ssl.create_default_context(cafile=ca_path)
-
-        if info.server_info.insecure_skip_tls_verify:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+        ssl_context = _ssl_context(ca_path, client_cert_path, client_key_path,
+                                   bool(info.server_info.insecure_skip_tls_verify))
 
         headers: dict[str, str] = {}
         scheme, token = info.client_info.scheme, info.client_info.token
@@ -316,17 +384,32 @@ class APIContext:
             # Delay import until runtime for environments without aiohttp
             auth = aiohttp.BasicAuth(username, password)
 
+        # Sessions created on the same loop share one connection pool instead of keeping one each.
+        # The first session on a loop owns the connector and closes it, the others only borrow it.
+        loop_connectors: dict[int, tuple[asyncio.AbstractEventLoop, aiohttp.TCPConnector]] = {}
+
         def default_factory(stream: bool = False):
+            if stream:
+                connector = aiohttp.TCPConnector(limit=MAX_STREAMS_PER_LOOP, ssl=ssl_context, keepalive_timeout=None)
+                connector_owner = True
+            else:
+                loop = asyncio.get_running_loop()
+                connector_loop, connector = loop_connectors.get(id(loop), (None, None))
+                connector_owner = connector_loop is not loop or connector.closed
+                if connector_owner:
+                    connector = aiohttp.TCPConnector(
+                        limit=MAX_CONNECTIONS_PER_SESSION * self._sessions_per_worker,
+                        ssl=ssl_context,
+                        keepalive_timeout=KEEPALIVE_TIMEOUT
+                    )
+                    loop_connectors[id(loop)] = loop, connector
             return aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(
-                    limit=MAX_STREAMS_PER_LOOP if stream else 100,
-                    ssl=ssl_context,
-                    keepalive_timeout=120 if not stream else None
-                ),
+                connector=connector,
+                connector_owner=connector_owner,
                 timeout=aiohttp.ClientTimeout(total=60),
                 read_bufsize=2 ** 21,  # 2 MB (4MB effective limit). Enough for the default k8s object limit of 1MB.
                 max_line_size=2 ** 20,
-                json_serialize=functools.partial(json.dumps, separators=(',', ':')),
+                json_serialize=json_dumps,
                 base_url=self.server,
                 headers=headers,
                 auth=auth
@@ -347,8 +430,8 @@ class APIContext:
             for session in range(self._sessions_per_worker):
                 self._address_book.append((worker, session))
 
-        self._rr_lock = threading.Lock()
-        self._rr_counter = 0
+        # next() on itertools.count is atomic under the GIL, so round-robin needs no lock
+        self._rr_counter = itertools.count()
         self._closed = threading.Event()
 
         # Keep tempfiles for manual cleanup if needed
@@ -357,19 +440,12 @@ class APIContext:
         # Per-task binding of (worker_idx, session_idx) for .session / .loop / .call
         self._current_addr: ContextVar[tuple[int, int]] = ContextVar(f"api_ctx_addr_{id(self)}")
 
-        # Stream-watch clients, one per event loop
+        # Stream-watch clients, one per event loop. Loops are kept to close the clients on their own loop later.
         self._stream_clients: dict[int, aiohttp.ClientSession] = {}
+        self._stream_loops: dict[int, asyncio.AbstractEventLoop] = {}
 
     def _choose_address(self) -> tuple[int, int]:
-        with self._rr_lock:
-            size = len(self._address_book)
-            if size == 0:
-                raise RuntimeError("APIContext session address book is empty")
-
-            # Normalized round-robin counter
-            idx = self._rr_counter % size
-            self._rr_counter = (idx + 1) % size
-            return self._address_book[idx]
+        return self._address_book[next(self._rr_counter) % len(self._address_book)]
 
     @property
     def session(self) -> aiohttp.ClientSession:
@@ -406,6 +482,15 @@ class APIContext:
             raise RuntimeError("APIContext.loop used outside APIContext.call()")
         return self._workers[worker_idx].loop
 
+    async def _run_bound(self, address: tuple[int, int], fn: Callable[..., Any],
+                         args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """Run `fn` with .session/.loop bound to the given (worker, session) address."""
+        token = self._current_addr.set(address)
+        try:
+            return await fn(*args, **kwargs, _context=self)
+        finally:
+            self._current_addr.reset(token)
+
     async def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Awaitable | AsyncIterable:
         """
         Run user async function `fn` on one worker's loop with one specific session bound.
@@ -418,28 +503,26 @@ class APIContext:
         if self.closed:
             raise RuntimeError("APIContext is closed")
 
-        worker_idx, session_idx = self._choose_address()
-        worker = self._workers[worker_idx]
+        address = self._choose_address()
+        worker = self._workers[address[0]]
 
         is_generator = inspect.isasyncgenfunction(fn)
         if not is_generator:
-            async def _runner() -> Any:
-                token = self._current_addr.set((worker_idx, session_idx))
-                try:
-                    return await fn(*args, **kwargs, _context=self)
-                finally:
-                    self._current_addr.reset(token)
-
-            fut = asyncio.run_coroutine_threadsafe(_runner(), worker.loop)
+            runner = self._run_bound(address, fn, args, kwargs)
+            # Already on the worker loop (e.g. a nested call with threads=1): no need to hop across threads
+            if asyncio.get_running_loop() is worker.loop:
+                return await runner
+            fut = asyncio.run_coroutine_threadsafe(runner, worker.loop)
             return await asyncio.wrap_future(fut)
 
         # Get the loop where `await call()` is happening
         loop = asyncio.get_running_loop()
         loop_id = id(loop)
 
-        # Create or reuse httpx.AsyncClient bound to this loop
+        # Create or reuse aiohttp.ClientSession bound to this loop
         if loop_id not in self._stream_clients:
             self._stream_clients[loop_id] = self._session_factory()
+            self._stream_loops[loop_id] = loop
 
         async def _proxy():
             """
@@ -462,9 +545,30 @@ class APIContext:
         if self.closed:
             return
         self._closed.set()
+        # Signal all workers first, so they close their sessions in parallel
+        for w in self._workers:
+            w.stop(wait=False)
         for w in self._workers:
             w.stop()
+        self._close_stream_clients()
         # tempfiles will be purged by _TempFiles.__del__
 
+    def _close_stream_clients(self) -> None:
+        """
+        Stream clients live on the callers' loops, not on workers, so close each one on its own loop.
+        Clients of loops which are not running anymore can't be closed gracefully, they are just dropped.
+        """
+        for loop_id, client in self._stream_clients.items():
+            loop = self._stream_loops.get(loop_id)
+            close = getattr(client, "close", None)
+            if loop is None or loop.is_closed() or not loop.is_running() or close is None:
+                continue
+            if asyncio.iscoroutinefunction(close):
+                asyncio.run_coroutine_threadsafe(close(), loop)
+            else:
+                loop.call_soon_threadsafe(close)
+        self._stream_clients.clear()
+        self._stream_loops.clear()
+
 
 _auth_vault_var.set(dict())
@@ -3,8 +3,12 @@ Utils to work with JSON Patch (RFC 6902).
 """
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 import copy
+import functools
+
+# Immutable JSON leaves: safe to put into patch ops without copying
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
 
 
 def _list_opcodes(old_list: list[Any], new_list: list[Any]) -> list[tuple[str, int, int, int, int]]:
@@ -15,6 +19,42 @@ def _list_opcodes(old_list: list[Any], new_list: list[Any]) -> list[tuple[str, i
     """
     n, m = len(old_list), len(new_list)
 
+    # Common head and tail are equal anyway, keep them out of the quadratic DP.
+    # A typical update touches a few items of a long list, so the DP then runs on those only.
+    prefix = 0
+    while prefix < n and prefix < m and old_list[prefix] == new_list[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < n - prefix and suffix < m - prefix and old_list[n - 1 - suffix] == new_list[m - 1 - suffix]:
+        suffix += 1
+
+    opcodes: list[tuple[str, int, int, int, int]] = []
+    if prefix:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+    for tag, i1, i2, j1, j2 in _list_opcodes_dp(old_list[prefix:n - suffix], new_list[prefix:m - suffix]):
+        opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        opcodes.append(("equal", n - suffix, n, m - suffix, m))
+
+    # Merge adjacent same-tag ops
+    merged: list[tuple[str, int, int, int, int]] = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if merged and merged[-1][0] == tag:
+            _, mi1, mi2, mj1, mj2 = merged[-1]
+            if mi2 == i1 and mj2 == j1:
+                merged[-1] = (tag, mi1, i2, mj1, j2)
+            else:
+                merged.append((tag, i1, i2, j1, j2))
+        else:
+            merged.append((tag, i1, i2, j1, j2))
+
+    return merged
+
+
+def _list_opcodes_dp(old_list: list[Any], new_list: list[Any]) -> list[tuple[str, int, int, int, int]]:
+    """Unmerged opcodes from the edit distance matrix, O(len(old_list) * len(new_list))."""
+    n, m = len(old_list), len(new_list)
+
     # DP matrix for edit distance with costs: equal=0, replace=1, delete=1, insert=1
     distance = [[0] * (m + 1) for _ in range(n + 1)]
     for i in range(1, n + 1):
@@ -55,20 +95,7 @@ def _list_opcodes(old_list: list[Any], new_list: list[Any]) -> list[tuple[str, i
             j -= 1
 
     opcodes.reverse()
-
-    # Merge adjacent same-tag ops
-    merged: list[tuple[str, int, int, int, int]] = []
-    for tag, i1, i2, j1, j2 in opcodes:
-        if merged and merged[-1][0] == tag:
-            _, mi1, mi2, mj1, mj2 = merged[-1]
-            if mi2 == i1 and mj2 == j1:
-                merged[-1] = (tag, mi1, i2, mj1, j2)
-            else:
-                merged.append((tag, i1, i2, j1, j2))
-        else:
-            merged.append((tag, i1, i2, j1, j2))
-
-    return merged
+    return opcodes
 
 
 Json = list | dict
@@ -79,13 +106,17 @@ def escape_json_path_pointer_token(token: str) -> str:
     return token.replace("~", "~0").replace("/", "~1")
 
 def _join_path(base_path: str, token: str) -> str:
+    # Most keys have nothing to escape, skip the replace() scans for them
+    if "~" in token or "/" in token:
+        token = escape_json_path_pointer_token(token)
     if base_path == "" or base_path == "/":
-        return "/" + escape_json_path_pointer_token(token)
-    return base_path + "/" + escape_json_path_pointer_token(token)
+        return "/" + token
+    return base_path + "/" + token
 
 def _diff_dict(old_map: dict[str, Any], new_map: dict[str, Any], json_pointer: str, patch_ops: list[Op]) -> None:
-    old_keys = set(old_map.keys())
-    new_keys = set(new_map.keys())
+    # Set algebra on the dict views directly, no intermediate sets of all keys
+    old_keys = old_map.keys()
+    new_keys = new_map.keys()
 
     # removals
     for key in sorted(old_keys - new_keys):
@@ -95,9 +126,12 @@ def _diff_dict(old_map: dict[str, Any], new_map: dict[str, Any], json_pointer: s
     for key in sorted(new_keys - old_keys):
         patch_ops.append({"op": "add", "path": _join_path(json_pointer, key), "value": copy.deepcopy(new_map[key])})
 
-    # updates
+    # updates; unchanged values are skipped before building their path
     for key in sorted(old_keys & new_keys):
-        _diff_any(old_map[key], new_map[key], _join_path(json_pointer, key), patch_ops)
+        old_value, new_value = old_map[key], new_map[key]
+        if old_value is new_value or old_value == new_value:
+            continue
+        _diff_changed(old_value, new_value, _join_path(json_pointer, key), patch_ops)
 
 def _diff_list(old_list: list[Any], new_list: list[Any], json_pointer: str, patch_ops: list[Op]) -> None:
     """
@@ -124,8 +158,13 @@ def _diff_list(old_list: list[Any], new_list: list[Any], json_pointer: str, patc
             raise RuntimeError(f"Unexpected opcode tag: {tag}")
 
 def _diff_any(old_value: Any, new_value: Any, json_pointer: str, patch_ops: list[Op]) -> None:
-    if old_value == new_value:
+    # Identity first: shared subtrees are skipped without walking them
+    if old_value is new_value or old_value == new_value:
         return
+    _diff_changed(old_value, new_value, json_pointer, patch_ops)
+
+def _diff_changed(old_value: Any, new_value: Any, json_pointer: str, patch_ops: list[Op]) -> None:
+    # Values are known to differ: the caller has already done the deep equality check
 
     # Different types -> replace
     if type(old_value) is not type(new_value):
@@ -139,7 +178,8 @@ def _diff_any(old_value: Any, new_value: Any, json_pointer: str, patch_ops: list
         _diff_list(old_value, new_value, json_pointer, patch_ops)
     else:
         # scalars differ -> replace
-        patch_ops.append({"op": "replace", "path": json_pointer, "value": copy.deepcopy(new_value)})
+        value = new_value if type(new_value) in _SCALAR_TYPES else copy.deepcopy(new_value)
+        patch_ops.append({"op": "replace", "path": json_pointer, "value": value})
 
 def json_patch_from_diff(old_doc: Json, new_doc: Json) -> list[Op]:
     """
@@ -150,6 +190,8 @@ def json_patch_from_diff(old_doc: Json, new_doc: Json) -> list[Op]:
         RFC6902 JSON Patch object
     """
     patch_ops: list[Op] = []
+    if old_doc is new_doc:
+        return patch_ops
 
     # Special case: root replacement when types differ
     if type(old_doc) is not type(new_doc):
@@ -171,18 +213,26 @@ class JsonPointerError(Exception): pass
 class JsonPatchTestFailed(Exception): pass
 
 
-def _parse_pointer(json_pointer: str) -> tuple[bool, list[str]]:
+@functools.lru_cache(maxsize=4096)
+def _parse_pointer_cached(json_pointer: str) -> tuple[bool, tuple[str, ...]]:
+    """Decoded pointer tokens. Patches keep touching the same paths, so each pointer is decoded once."""
     if not json_pointer:
         raise JsonPointerError("Empty JSON Pointer")
     if json_pointer == "/":
-        return True, []
+        return True, ()
     if not json_pointer.startswith("/"):
         raise JsonPointerError(f"Invalid JSON Pointer: {json_pointer}")
     tokens = json_pointer.split("/")[1:]
-    decoded = [t.replace("~1", "/").replace("~0", "~") for t in tokens]
-    return False, decoded
+    if "~" not in json_pointer:
+        return False, tuple(tokens)
+    return False, tuple(t.replace("~1", "/").replace("~0", "~") for t in tokens)
+
+
+def _parse_pointer(json_pointer: str) -> tuple[bool, list[str]]:
+    is_root, tokens = _parse_pointer_cached(json_pointer)
+    return is_root, list(tokens)
 
-def _get_at_pointer(root: Any, tokens: list[str]) -> Any:
+def _get_at_pointer(root: Any, tokens: Sequence[str]) -> Any:
     """Return the value located at the JSON Pointer tokens."""
     if not tokens:
         return root
@@ -202,7 +252,7 @@ def _get_at_pointer(root: Any, tokens: list[str]) -> Any:
             raise JsonPointerError("Cannot traverse into scalar")
     return node
 
-def _resolve_parent(root: Any, tokens: list[str]) -> tuple[Any, str]:
+def _resolve_parent(root: Any, tokens: Sequence[str]) -> tuple[Any, str]:
     """
     Resolve to the parent container of the final token.
     Returns (parent_node, last_token).
@@ -221,175 +271,190 @@ def _resolve_parent(root: Any, tokens: list[str]) -> tuple[Any, str]:
     return current_node, tokens[-1]
 
 
-def apply_patch(document: Json, patch_ops: list[Op]) -> Json:
-    """
-    Apply JSON Patch operations (RFC 6902): add, remove, replace, move, copy, test.
-    Returns a deep-copied patched document.
-    Notes:
-      - Root removal is disallowed (raises JsonPointerError), matching previous behavior.
-      - Array appends use "-" (allowed for add/copy/move destinations; not valid for remove/replace/test).
-    """
-    result = copy.deepcopy(document)
+def _apply_test(result: Json, op: Op, is_root: bool, tokens: Sequence[str]) -> Json:
+    expected = op.get("value")
+    target_value = result if is_root else _get_at_pointer(result, tokens)
+    if target_value != expected:
+        raise JsonPatchTestFailed(f"Test failed at path {op['path']}")
+    return result
 
-    for op in patch_ops:
-        operation = op["op"]
-        path = op["path"]
-        is_root, tokens = _parse_pointer(path)
-
-        if operation == "test":
-            expected = op.get("value")
-            target_value = result if is_root else _get_at_pointer(result, tokens)
-            if target_value != expected:
-                raise JsonPatchTestFailed(f"Test failed at path {path}")
-            continue
 
-        if operation == "copy":
-            from_path = op["from"]
-            from_is_root, from_tokens = _parse_pointer(from_path)
-            source_value = result if from_is_root else _get_at_pointer(result, from_tokens)
-            value_to_set = copy.deepcopy(source_value)
+def _apply_copy(result: Json, op: Op, is_root: bool, tokens: Sequence[str]) -> Json:
+    from_path = op["from"]
+    from_is_root, from_tokens = _parse_pointer_cached(from_path)
+    source_value = result if from_is_root else _get_at_pointer(result, from_tokens)
+    value_to_set = copy.deepcopy(source_value)
+
+    if is_root:
+        return value_to_set
+    parent_node, last_token = _resolve_parent(result, tokens)
+    if isinstance(parent_node, dict):
+        parent_node[last_token] = value_to_set
+    elif isinstance(parent_node, list):
+        if last_token == '-':
+            parent_node.append(value_to_set)
+        else:
+            try:
+                idx = int(last_token)
+            except Exception as e:
+                raise JsonPointerError("Invalid array index") from e
+            parent_node.insert(idx, value_to_set)
+    else:
+        raise JsonPointerError("Invalid copy target")
+    return result
 
-            if is_root:
-                result = value_to_set
-            else:
-                parent_node, last_token = _resolve_parent(result, tokens)
-                if isinstance(parent_node, dict):
-                    parent_node[last_token] = value_to_set
-                elif isinstance(parent_node, list):
-                    if last_token == '-':
-                        parent_node.append(value_to_set)
-                    else:
-                        try:
-                            idx = int(last_token)
-                        except Exception as e:
-                            raise JsonPointerError("Invalid array index") from e
-                        parent_node.insert(idx, value_to_set)
-                else:
-                    raise JsonPointerError("Invalid copy target")
-            continue
 
-        if operation == "move":
-            from_path = op["from"]
-            from_is_root, from_tokens = _parse_pointer(from_path)
-            if from_is_root:
-                raise JsonPointerError("Moving the root is not supported")
-
-            source_parent, source_last = _resolve_parent(result, from_tokens)
-            source_index = 0  # we define it here to make linter happy
-            if isinstance(source_parent, dict):
-                moving_value = source_parent[source_last]
-            elif isinstance(source_parent, list):
-                try:
-                    source_index = int(source_last)
-                except Exception as e:
-                    raise JsonPointerError("Invalid array index") from e
-                moving_value = source_parent[source_index]
+def _apply_move(result: Json, op: Op, is_root: bool, tokens: Sequence[str]) -> Json:
+    from_path = op["from"]
+    from_is_root, from_tokens = _parse_pointer_cached(from_path)
+    if from_is_root:
+        raise JsonPointerError("Moving the root is not supported")
+
+    source_parent, source_last = _resolve_parent(result, from_tokens)
+    source_index = 0  # we define it here to make linter happy
+    if isinstance(source_parent, dict):
+        moving_value = source_parent[source_last]
+    elif isinstance(source_parent, list):
+        try:
+            source_index = int(source_last)
+        except Exception as e:
+            raise JsonPointerError("Invalid array index") from e
+        moving_value = source_parent[source_index]
+    else:
+        raise JsonPointerError("Invalid move source")
+
+    if is_root:
+        if isinstance(source_parent, dict):
+            del source_parent[source_last]
+        else:
+            del source_parent[source_index]
+        return copy.deepcopy(moving_value)
+
+    dest_parent, dest_last = _resolve_parent(result, tokens)
+    if isinstance(dest_parent, dict):
+        if isinstance(source_parent, dict):
+            del source_parent[source_last]
+        else:
+            del source_parent[source_index]
+        dest_parent[dest_last] = moving_value
+    elif isinstance(dest_parent, list):
+        if dest_last == '-':
+            dest_index = len(dest_parent)
+        else:
+            try:
+                dest_index = int(dest_last)
+            except Exception as e:
+                raise JsonPointerError("Invalid array index") from e
+
+        same_list = (dest_parent is source_parent)
+        if isinstance(source_parent, list):
+            if same_list and source_index < dest_index:
+                adjusted_dest_index = dest_index - 1
             else:
-                raise JsonPointerError("Invalid move source")
+                adjusted_dest_index = dest_index
+        else:
+            adjusted_dest_index = dest_index
 
-            if is_root:
-                if isinstance(source_parent, dict):
-                    del source_parent[source_last]
-                else:
-                    del source_parent[source_index]
-                result = copy.deepcopy(moving_value)
-                continue
+        if isinstance(source_parent, dict):
+            del source_parent[source_last]
+        else:
+            del source_parent[source_index]
 
-            dest_parent, dest_last = _resolve_parent(result, tokens)
-            if isinstance(dest_parent, dict):
-                if isinstance(source_parent, dict):
-                    del source_parent[source_last]
-                else:
-                    del source_parent[source_index]
-                dest_parent[dest_last] = moving_value
-            elif isinstance(dest_parent, list):
-                if dest_last == '-':
-                    dest_index = len(dest_parent)
-                else:
-                    try:
-                        dest_index = int(dest_last)
-                    except Exception as e:
-                        raise JsonPointerError("Invalid array index") from e
-
-                same_list = (dest_parent is source_parent)
-                if isinstance(source_parent, list):
-                    if same_list and source_index < dest_index:
-                        adjusted_dest_index = dest_index - 1
-                    else:
-                        adjusted_dest_index = dest_index
-                else:
-                    adjusted_dest_index = dest_index
+        dest_parent.insert(adjusted_dest_index, moving_value)
+    else:
+        raise JsonPointerError("Invalid move target")
+    return result
 
-                if isinstance(source_parent, dict):
-                    del source_parent[source_last]
-                else:
-                    del source_parent[source_index]
 
-                dest_parent.insert(adjusted_dest_index, moving_value)
-            else:
-                raise JsonPointerError("Invalid move target")
-            continue
+def _apply_remove(result: Json, op: Op, is_root: bool, tokens: Sequence[str]) -> Json:
+    if is_root:
+        raise JsonPointerError("Removing the root is not supported")
+    parent_node, last_token = _resolve_parent(result, tokens)
+    if isinstance(parent_node, dict):
+        parent_node.pop(last_token, None)
+    elif isinstance(parent_node, list):
+        if last_token == '-':
+            raise JsonPointerError("'-' is not valid for remove")
+        try:
+            idx = int(last_token)
+        except Exception as e:
+            raise JsonPointerError("Invalid array index") from e
+        del parent_node[idx]
+    else:
+        raise JsonPointerError("Invalid remove target")
+    return result
 
-        if operation == "remove":
-            if is_root:
-                raise JsonPointerError("Removing the root is not supported")
-            parent_node, last_token = _resolve_parent(result, tokens)
-            if isinstance(parent_node, dict):
-                parent_node.pop(last_token, None)
-            elif isinstance(parent_node, list):
-                if last_token == '-':
-                    raise JsonPointerError("'-' is not valid for remove")
-                try:
-                    idx = int(last_token)
-                except Exception as e:
-                    raise JsonPointerError("Invalid array index") from e
-                del parent_node[idx]
-            else:
-                raise JsonPointerError("Invalid remove target")
-            continue
 
-        if operation == "add":
-            value = copy.deepcopy(op["value"])
-            if is_root:
-                result = value
-            else:
-                parent_node, last_token = _resolve_parent(result, tokens)
-                if isinstance(parent_node, dict):
-                    parent_node[last_token] = value
-                elif isinstance(parent_node, list):
-                    if last_token == '-':
-                        parent_node.append(value)
-                    else:
-                        try:
-                            idx = int(last_token)
-                        except Exception as e:
-                            raise JsonPointerError("Invalid array index") from e
-                        parent_node.insert(idx, value)
-                else:
-                    raise JsonPointerError("Invalid add target")
-            continue
+def _apply_add(result: Json, op: Op, is_root: bool, tokens: Sequence[str]) -> Json:
+    value = copy.deepcopy(op["value"])
+    if is_root:
+        return value
+    parent_node, last_token = _resolve_parent(result, tokens)
+    if isinstance(parent_node, dict):
+        parent_node[last_token] = value
+    elif isinstance(parent_node, list):
+        if last_token == '-':
+            parent_node.append(value)
+        else:
+            try:
+                idx = int(last_token)
+            except Exception as e:
+                raise JsonPointerError("Invalid array index") from e
+            parent_node.insert(idx, value)
+    else:
+        raise JsonPointerError("Invalid add target")
+    return result
 
-        if operation == "replace":
-            value = copy.deepcopy(op["value"])
-            if is_root:
-                result = value
-            else:
-                parent_node, last_token = _resolve_parent(result, tokens)
-                if isinstance(parent_node, dict):
-                    parent_node[last_token] = value
-                elif isinstance(parent_node, list):
-                    if last_token == '-':
-                        raise JsonPointerError("'-' is not valid for replace")
-                    try:
-                        idx = int(last_token)
-                    except Exception as e:
-                        raise JsonPointerError("Invalid array index") from e
-                    parent_node[idx] = value
-                else:
-                    raise JsonPointerError("Invalid replace target")
-            continue
 
-        raise NotImplementedError(f"Unsupported op: {operation}")
+def _apply_replace(result: Json, op: Op, is_root: bool, tokens: Sequence[str]) -> Json:
+    value = copy.deepcopy(op["value"])
+    if is_root:
+        return value
+    parent_node, last_token = _resolve_parent(result, tokens)
+    if isinstance(parent_node, dict):
+        parent_node[last_token] = value
+    elif isinstance(parent_node, list):
+        if last_token == '-':
+            raise JsonPointerError("'-' is not valid for replace")
+        try:
+            idx = int(last_token)
+        except Exception as e:
+            raise JsonPointerError("Invalid array index") from e
+        parent_node[idx] = value
+    else:
+        raise JsonPointerError("Invalid replace target")
+    return result
+
+
+# Each handler takes the current document and returns the patched one (a new object for root targets)
+_APPLY_OPS = {
+    "test": _apply_test,
+    "copy": _apply_copy,
+    "move": _apply_move,
+    "remove": _apply_remove,
+    "add": _apply_add,
+    "replace": _apply_replace,
+}
+
+
+def apply_patch(document: Json, patch_ops: list[Op]) -> Json:
+    """
+    Apply JSON Patch operations (RFC 6902): add, remove, replace, move, copy, test.
+    Returns a deep-copied patched document.
+    Notes:
+      - Root removal is disallowed (raises JsonPointerError), matching previous behavior.
+      - Array appends use "-" (allowed for add/copy/move destinations; not valid for remove/replace/test).
+    """
+    result = copy.deepcopy(document)
+
+    for op in patch_ops:
+        operation = op["op"]
+        is_root, tokens = _parse_pointer_cached(op["path"])
+        try:
+            apply_op = _APPLY_OPS[operation]
+        except KeyError:
+            raise NotImplementedError(f"Unsupported op: {operation}") from None
+        result = apply_op(result, op, is_root, tokens)
 
     return result
 
@@ -455,7 +520,8 @@ def guard_lists_from_json_patch_replacement(json_patch: list[dict[str, Any]], la
 
     For each op:
       - If path targets inside a list item -> add `test` for all leaf key/values under that item.
-      - Else if path targets a list root -> add `test` for leaves under every item currently in the list.
+      - Else if path targets a list root -> add `test` for leaves under every item currently in the list,
+        or a single `test` of the whole list when it holds scalars only.
 
     :param json_patch: RFC6902 JSON Patch object
     :param latest_known_resource: version of the object which is supposed to be patched
@@ -474,6 +540,18 @@ def guard_lists_from_json_patch_replacement(json_patch: list[dict[str, Any]], la
             segments = [] if pointer == "" else [s for s in pointer.split("/") if s != ""]
         item_roots = _list_item_roots_for_path(latest_known_resource, segments)
 
+        # Whole list of scalars is targeted: one test of the list value is enough,
+        # and unlike per-item tests it also catches items appended concurrently
+        if item_roots and len(item_roots[0]) == len(segments) + 1:
+            list_node = _get_at_pointer(latest_known_resource, segments)
+            if not any(isinstance(item, (dict, list)) for item in list_node):
+                root_ptrs = ["/" + "/".join(root) for root in item_roots]
+                if not tested_roots.issuperset(root_ptrs):
+                    tested_roots.update(root_ptrs)
+                    new_json_patch.append({"op": "test", "path": "/" + "/".join(segments), "value": list(list_node)})
+                new_json_patch.append(op)
+                continue
+
         # Insert tests once per item root
         for root in item_roots:
             root_ptr = "/" + "/".join(root)
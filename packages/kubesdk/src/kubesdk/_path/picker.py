@@ -16,8 +16,7 @@ class PathRoot:
         object.__setattr__(self, "_segments", segments or [])
 
     def __getattr__(self, name: str) -> PathRoot:
-        if name.startswith("__") and name.endswith("__"):
-            raise AttributeError(name)
+        # Covers dunders as well
         if name.startswith("_"):
             raise AttributeError(name)
         return PathRoot([*self._segments, name])
@@ -132,12 +131,16 @@ class PathPicker(Generic[_LeafT]):
         return cast(_LeafT, current)
 
 
+# PathRoot is never mutated, every step builds a new one, so a single empty root can be shared
+_EMPTY_ROOT = PathRoot()
+
+
 def from_root_(cls: Type[_RootT]) -> _RootT:
     """
     :param cls: Type of the object (normally - class) to point a path on its instances.
     :return: A typed proxy root for building a PathPicker from it.
     """
-    return cast(_RootT, PathRoot())
+    return cast(_RootT, _EMPTY_ROOT)
 
 
 @overload
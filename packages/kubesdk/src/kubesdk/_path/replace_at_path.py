@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import is_dataclass, replace as dc_replace
-from typing import Any, TypeVar, Sequence, cast
+from typing import Any, TypeVar, Sequence, Iterable, cast
 from collections.abc import MutableMapping
 
 from .picker import PathKey, PathPicker, _resolve_segment
@@ -25,8 +25,11 @@ def _replace_recursive(
     # Read child
     child = _resolve_segment(current, segment, index=index, segments=full_segments)
     updated_child = _replace_recursive(child, tail, new_value, full_segments, index + 1)
+    return _write_child(current, segment, updated_child)
 
-    # Now decide how to write back based on container & segment types
+
+def _write_child(current: Any, segment: PathKey, updated_child: Any) -> Any:
+    # Decide how to write back based on container & segment types
     if isinstance(segment, int):
         if isinstance(current, list):
             new_list = list(current)
@@ -77,6 +80,38 @@ def _replace_recursive(
     return current
 
 
+def _replace_many_recursive(
+    current: Any,
+    changes: Sequence[tuple[Sequence[PathKey], Any, Sequence[PathKey]]],
+    index: int
+) -> Any:
+    # A change ending at this level overrides the node and everything applied before it
+    for i in range(len(changes) - 1, -1, -1):
+        remaining, new_value, _ = changes[i]
+        if not remaining:
+            current, changes = new_value, changes[i + 1:]
+            break
+
+    # Group the rest by the next segment, so every shared parent is rebuilt only once
+    grouped: dict[PathKey, list[tuple[Sequence[PathKey], Any, Sequence[PathKey]]]] = {}
+    for remaining, new_value, full_segments in changes:
+        grouped.setdefault(remaining[0], []).append((remaining[1:], new_value, full_segments))
+
+    updated_children = {}
+    for segment, child_changes in grouped.items():
+        child = _resolve_segment(current, segment, index=index, segments=child_changes[0][2])
+        updated_children[segment] = _replace_many_recursive(child, child_changes, index + 1)
+
+    # One dataclasses.replace() per dataclass instead of one per changed field
+    if len(updated_children) > 1 and is_dataclass(current) and not isinstance(current, MutableMapping) \
+            and all(isinstance(seg, str) and hasattr(current, seg) for seg in updated_children):
+        return dc_replace(current, **updated_children)
+
+    for segment, updated_child in updated_children.items():
+        current = _write_child(current, segment, updated_child)
+    return current
+
+
 def replace_(obj: _ObjectT, path: PathPicker[_ValueT], new_value: _ValueT) -> _ObjectT:
     """
     Deep analogue of dataclasses.replace() using PathPicker.
@@ -89,3 +124,19 @@ def replace_(obj: _ObjectT, path: PathPicker[_ValueT], new_value: _ValueT) -> _O
     :raises PathResolutionError: If any path segment cannot be resolved.
     """
     return cast(_ObjectT, _replace_recursive(obj, path.segments, new_value, path.segments, 0))
+
+
+def replace_many_(obj: _ObjectT, changes: Iterable[tuple[PathPicker[Any], Any]]) -> _ObjectT:
+    """
+    Same as chained replace_() calls, but objects on shared path prefixes are copied only once.
+    Changes are applied in order, so a later change wins over an earlier one on the same path.
+
+    :param obj: Object to make replacements on.
+    :param changes: Pairs of (path, new value).
+    :returns: New object with all the values replaced.
+    :raises PathResolutionError: If any path segment cannot be resolved.
+    """
+    prepared = [(path.segments, new_value, path.segments) for path, new_value in changes]
+    if not prepared:
+        return obj
+    return cast(_ObjectT, _replace_many_recursive(obj, prepared, 0))
@@ -5,11 +5,23 @@
 # Copyright (c) 2019-2020 Zalando SE
 # Licensed under the MIT License; see the LICENSE file or https://opensource.org/licenses/MIT
 import os
+import hashlib
 import tempfile
+import threading
 
 from typing import Mapping, Iterator
 
 
+# Files with the same content are shared by all containers in the process: re-logins keep recreating
+# contexts with the same CA/client certificates. Keyed by content digest, valued by [path, refcount].
+_shared_paths: dict[bytes, list] = {}
+_shared_paths_lock = threading.Lock()
+
+
+def _content_key(item: bytes) -> bytes:
+    return hashlib.blake2b(item, digest_size=16).digest()
+
+
 class _TempFiles(Mapping[bytes, str]):
     """
     A container for the temporary files, which are purged on garbage collection.
@@ -17,13 +29,17 @@ class _TempFiles(Mapping[bytes, str]):
     The files are purged when the container is garbage-collected. The container
     is garbage-collected when its parent `APISession` is garbage-collected or
     explicitly closed (by `Vault` on removal of corresponding credentials).
+
+    A file is shared with other containers holding the same content,
+    and is removed when the last of them purges it.
     """
     _path_suffix: str
-    _paths: dict[bytes, str]
+    _paths: dict[bytes, tuple[str, bytes]]
 
     def __init__(self, path_suffix: str) -> None:
         super().__init__()
-        self._paths: dict[bytes, str] = {}
+        # Keyed by content digest: fresh bytes objects (e.g. from b64decode) are not rehashed in full on every lookup
+        self._paths: dict[bytes, tuple[str, bytes]] = {}
         self._path_suffix = path_suffix
 
     def __del__(self) -> None:
@@ -33,19 +49,34 @@ class _TempFiles(Mapping[bytes, str]):
         return len(self._paths)
 
     def __iter__(self) -> Iterator[bytes]:
-        return iter(self._paths)
+        return (item for _, item in self._paths.values())
 
     def __getitem__(self, item: bytes) -> str:
-        if item not in self._paths:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=self._path_suffix) as f:
-                f.write(item)
-            self._paths[item] = f.name
-        return self._paths[item]
+        key = _content_key(item)
+        known = self._paths.get(key)
+        if known is not None:
+            return known[0]
+        with _shared_paths_lock:
+            shared = _shared_paths.get(key)
+            if shared is None or not os.path.exists(shared[0]):
+                with tempfile.NamedTemporaryFile(delete=False, suffix=self._path_suffix) as f:
+                    f.write(item)
+                shared = _shared_paths[key] = [f.name, 0]
+            shared[1] += 1
+        self._paths[key] = shared[0], item
+        return shared[0]
 
     def purge(self) -> None:
-        for _, path in self._paths.items():
-            try:
-                os.remove(path)
-            except OSError:
-                pass  # already removed
+        with _shared_paths_lock:
+            for key, (path, _) in self._paths.items():
+                shared = _shared_paths.get(key)
+                if shared is not None and shared[0] == path:
+                    shared[1] -= 1
+                    if shared[1] > 0:
+                        continue
+                    del _shared_paths[key]
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass  # already removed
         self._paths.clear()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sys
 import asyncio
+import functools
 import logging
 import json
 from enum import Enum
@@ -29,8 +30,10 @@ from kube_models import get_model
 from kube_models.const import PatchRequestType, StrEnum
 from kube_models.resource import K8sResource, K8sResourceList
 from kube_models.api_v1.io.k8s.apimachinery.pkg.apis.meta.v1 import DeleteOptions, Status
+from kube_models.api_v1.io.k8s.api.autoscaling.v1 import Scale
 
 from ._auth import authenticated, APIContext
+from .common import json_loads
 from .errors import *
 from ._patch.strategic_merge_patch import jsonpatch_to_smp
 from ._patch.json_patch import guard_lists_from_json_patch_replacement, json_patch_from_diff
@@ -44,9 +47,29 @@ _log = logging.getLogger(__name__)
 class APIRequestProcessingConfig:
     http_timeout: int | None = field(default=None)
     backoff_limit: int = field(default=3)
-    backoff_interval: int | Callable[[int], int] = field(default=5)
+    # Either a fixed interval, a per-attempt table (the last value repeats) or a function of the attempt number
+    backoff_interval: float | Sequence[float] | Callable[[int], float] = field(default=5)
     retry_statuses: Sequence[int | Type[RESTAPIError]] = field(default_factory=list)
 
+    # Frozen once per config: retry checks run on every response, and a set lookup is O(1)
+    _retry_statuses: frozenset[int | Type[RESTAPIError]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._retry_statuses = frozenset(self.retry_statuses)
+        if isinstance(self.backoff_interval, Sequence) and not self.backoff_interval:
+            raise ValueError("backoff_interval sequence must not be empty")
+
+    def should_retry(self, status: int, exc_cls: Type[RESTAPIError] | None) -> bool:
+        return status in self._retry_statuses or exc_cls in self._retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        interval = self.backoff_interval
+        if isinstance(interval, (int, float)):
+            return interval
+        if isinstance(interval, Sequence):
+            return interval[min(attempt, len(interval)) - 1]
+        return interval(attempt)
+
 
 @dataclass(kw_only=True)
 class APIRequestLoggingConfig:
@@ -82,14 +105,14 @@ class LabelSelectorOp(str, Enum):
     DoesNotExist = "DoesNotExist"
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class QueryLabelSelectorRequirement:
     key: str
     op: LabelSelectorOp
     values: Sequence[str] = field(default_factory=list)
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class QueryLabelSelector:
     matchLabels: Mapping[str, str] = field(default_factory=dict)
     matchExpressions: Sequence[QueryLabelSelectorRequirement] = field(default_factory=list)
@@ -120,7 +143,7 @@ class FieldSelectorOp(str, Enum):
     neq = "!="
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class FieldSelectorRequirement:
     # ToDo: Make `field` type of PathPicker to validate that the requested resource even have this field
     field: str
@@ -128,13 +151,13 @@ class FieldSelectorRequirement:
     value: str
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class FieldSelector:
     requirements: Sequence[FieldSelectorRequirement]
     def to_query_value(self) -> str: return ",".join(f"{r.field}{r.op.value}{r.value}" for r in self.requirements)
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class K8sQueryParams:
     pretty: str | None = None
     _continue: str | None = None  # will be turned into `continue` on request
@@ -153,41 +176,37 @@ class K8sQueryParams:
 
     def to_http_params(self) -> list[tuple[str, str]]:
         items = []
-        for f in fields(self):
-            name = f.name
+        for name, param in _QUERY_PARAM_NAMES:
             value = getattr(self, name)
             if value is None:
                 continue
 
-            if name == "_continue":
-                items.append(("continue", str(value)))
-                continue
-
-            if isinstance(value, FieldSelector):
-                items.append(("fieldSelector", value.to_query_value()))
-                continue
-
-            if isinstance(value, QueryLabelSelector):
-                items.append(("labelSelector", value.to_query_value()))
-                continue
-
-            if isinstance(value, Enum):
+            if isinstance(value, (FieldSelector, QueryLabelSelector)):
+                sval = value.to_query_value()
+            elif isinstance(value, Enum):
                 sval = value.value
             elif isinstance(value, bool):
                 sval = "true" if value else "false"
             else:
                 sval = str(value)
 
-            items.append((name, sval))
+            items.append((param, sval))
 
         return items
 
 
+# (field name, query parameter name) pairs, resolved once instead of walking fields() on every request
+_QUERY_PARAM_NAMES: tuple[tuple[str, str], ...] = tuple(
+    (f.name, "continue" if f.name == "_continue" else f.name) for f in fields(K8sQueryParams))
+
+
+def _is_status_response(response_json: Any) -> bool: return response_json.get("kind") == "Status"
+
+
 @dataclass(kw_only=True)
 class K8sAPIRequestLoggingConfig(APIRequestLoggingConfig):
     api_name: str = field(default="Kubernetes")
-    response_body: Callable[[Any], bool] | bool = \
-        field(default=lambda response_json: response_json.get("kind") == "Status")
+    response_body: Callable[[Any], bool] | bool = field(default=_is_status_response)
     errors_as_critical: bool = field(default=False)
 
 
@@ -195,6 +214,19 @@ DEFAULT_PROCESSING = APIRequestProcessingConfig()
 DEFAULT_LOGGING = K8sAPIRequestLoggingConfig()
 
 
+def _pins_resource_version(data: Any) -> bool:
+    """
+    Whether the request body carries a resourceVersion precondition:
+    either `metadata.resourceVersion` in an object/merge body, or a JSON Patch `test` op on it.
+    """
+    if isinstance(data, dict):
+        return bool((data.get("metadata") or {}).get("resourceVersion"))
+    if isinstance(data, list):
+        return any(isinstance(op, dict) and op.get("op") == "test" and op.get("path") == "/metadata/resourceVersion"
+                   for op in data)
+    return False
+
+
 async def _raw_api_request(
         method: HTTPMethod,
         url: str,
@@ -209,7 +241,7 @@ async def _raw_api_request(
     headers = headers or {}
     headers.setdefault("Accept", "application/json")
     api_name = log.api_name
-    max_attempts = min(1, processing.backoff_limit)
+    max_attempts = max(1, processing.backoff_limit)
     request_timeout = aiohttp.ClientTimeout(total=processing.http_timeout)
     extra_log = {
         "API": api_name,
@@ -217,7 +249,11 @@ async def _raw_api_request(
         "method": method,
         "request": data if log.request_body else None
     }
-    _log.debug(f"Requesting {api_name} API", extra=extra_log)
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug(f"Requesting {api_name} API", extra=extra_log)
+    # A 409 on a write pinned to a resourceVersion is a stale precondition,
+    # resending the very same body can never succeed, so fail fast instead of retrying
+    stale_conflict_is_final = _pins_resource_version(data)
     attempt = 0
 
     while attempt < max_attempts:
@@ -236,8 +272,8 @@ async def _raw_api_request(
 
             # Check if we have to retry forcibly
             exc_cls = ERROR_TYPE_BY_CODE.get(response.status)
-            to_retry = processing.retry_statuses
-            if (response.status in to_retry or exc_cls in to_retry) and attempt < max_attempts:
+            if processing.should_retry(response.status, exc_cls) and attempt < max_attempts \
+                    and not (response.status == 409 and stale_conflict_is_final):
                 _log.debug(
                     f"Retrying request due to {response.status} response status",
                     extra=extra_log | {"attempt": attempt, "status": response.status}
@@ -247,11 +283,7 @@ async def _raw_api_request(
                     await response.read()
                 finally:
                     response.release()
-                if callable(processing.backoff_interval):
-                    backoff = processing.backoff_interval(attempt)
-                else:
-                    backoff = processing.backoff_interval
-                await asyncio.sleep(backoff)
+                await asyncio.sleep(processing.backoff(attempt))
                 continue
 
             # We never parse response here because we don't know if it was stream or REST
@@ -273,7 +305,7 @@ async def _raw_api_request(
 
 async def __load_aiohttp_response(response: aiohttp.ClientResponse) -> dict | list | str:
     try:
-        return await response.json()
+        return await response.json(loads=json_loads)
     except (json.JSONDecodeError, aiohttp.ContentTypeError):
         return await response.text()
 
@@ -294,7 +326,7 @@ async def rest_api_request(
     """Used for all non-watch requests."""
     headers, return_api_exceptions = headers or {}, return_api_exceptions or []
     headers.setdefault("Accept", "application/json")
-    max_attempts = min(1, processing.backoff_limit)
+    max_attempts = max(1, processing.backoff_limit)
     error_msg = f"{log.api_name} API request failed"
     success_msg = f"{log.api_name} API request has been processed"
     extra_log = {
@@ -304,7 +336,8 @@ async def rest_api_request(
         "method": method,
         "request": data if log.request_body else None
     }
-    _log.debug(f"Requesting {log.api_name} API", extra=extra_log)
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug(f"Requesting {log.api_name} API", extra=extra_log)
 
     response = await _raw_api_request(
         method=method,
@@ -334,7 +367,7 @@ async def rest_api_request(
 
         # Check if we have to retry forcibly
         exc_cls = ERROR_TYPE_BY_CODE.get(response.status) or RESTAPIError
-        if response.status in processing.retry_statuses or exc_cls in processing.retry_statuses:
+        if processing.should_retry(response.status, exc_cls):
             raise exc_cls(response.status, f"{error_msg}, max_attempts={max_attempts} reached", response_data)
 
         # Check if we have to return or raise
@@ -356,7 +389,8 @@ async def rest_api_request(
 
         if log.on_success:
             _log.info(success_msg, extra=extra_log)
-        else:
+        elif _log.isEnabledFor(logging.DEBUG):
+            # Skip building the extra dict on every successful request unless debug is on
             _log.debug(success_msg, extra=extra_log | {"response": response_data})
 
         return response_data
@@ -381,7 +415,8 @@ async def stream_api_request(
         "server": _context.server,
         "method": method
     }
-    _log.debug(f"Requesting {api_name}", extra=extra_log)
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug(f"Requesting {api_name}", extra=extra_log)
 
     response = await _raw_api_request(
         method=method,
@@ -424,8 +459,10 @@ async def stream_api_request(
             _log_level(error_msg, extra=extra_log)
             raise api_error
 
+        # Bound once: the loop below runs for every watch event
+        readline, loads = response.content.readline, json_loads
         while True:
-            raw_line = await response.content.readline()
+            raw_line = await readline()
             if not raw_line:
                 # EOF
                 break
@@ -435,11 +472,20 @@ async def stream_api_request(
                 continue
 
             try:
-                yield json.loads(line.decode("utf-8"))
+                # Both json backends take UTF-8 bytes as is, no need to decode the line first
+                yield loads(line)
             except json.JSONDecodeError as e:
                 raise ValueError(f"Unable to decode k8s watch event JSON line: {e}. Offending line: {line!r}") from e
 
 
+@functools.lru_cache(maxsize=None)
+def _namespaced_api_path_parts(resource_cls: Type[K8sResource]) -> tuple[str, str, str]:
+    """Split api_path() of a namespaced resource once: (before namespace, after namespace, all-namespaces path)."""
+    path = resource_cls.api_path()
+    before, _, after = path.partition("{namespace}")
+    return before, after, path.replace("/namespaces/{namespace}", "")
+
+
 def __build_request_url(resource: Type[K8sResource] | K8sResource, name: str = None, namespace: str = None,
                         trim_name: bool = False) -> str:
     """
@@ -453,10 +499,9 @@ def __build_request_url(resource: Type[K8sResource] | K8sResource, name: str = N
         name = name or resource.metadata.name
 
     if resource.is_namespaced_:
-        if ns:
-            url = resource.api_path().format(namespace=ns)
-        else:
-            url = resource.api_path().replace("/namespaces/{namespace}", "")
+        before_ns, after_ns, all_namespaces = _namespaced_api_path_parts(
+            resource if isclass(resource) else type(resource))
+        url = f"{before_ns}{ns}{after_ns}" if ns else all_namespaces
     else:
         if ns:
             raise ValueError(f"Resource {resource.apiVersion} is cluster scoped, "
@@ -470,22 +515,31 @@ def __decode_k8s_rest_api_response(response: RESTAPIError) -> RESTAPIError[Statu
 @overload
 def __decode_k8s_rest_api_response(response: list | dict) -> K8sResource: ...
 
+_EMPTY_STATUS_ERR = "Empty Status object has been added to the response."
+
+
+def _status_from_error_response(response: dict | str) -> Status:
+    """
+    Loader of `RESTAPIError.extra`, runs on first access to it. A non-JSON response is reported when the error
+    is decoded, but a Status model mismatch can only be seen here, so its log is emitted on that first access.
+    """
+    if isinstance(response, dict):
+        try:
+            return Status.from_dict(response)
+        except Exception as e:
+            _log.critical(
+                f"K8s API error response does not match {Status.apiVersion} {Status.kind}. {_EMPTY_STATUS_ERR} "
+                f"Check the version of your k8s models ASAP!",
+                extra={"error": str(e), "response": str(response)})
+    return Status()
+
+
 def __decode_k8s_rest_api_response(response: list | dict | RESTAPIError):
     if isinstance(response, RESTAPIError):
-        empty_status_err = "Empty Status object has been added to the response."
-        if isinstance(response.response, dict):
-            try:
-                response.extra = Status.from_dict(response.response)
-            except Exception as e:
-                _log.critical(
-                    f"K8s API error response does not match {Status.apiVersion} {Status.kind}. {empty_status_err} "
-                    f"Check the version of your k8s models ASAP!",
-                    extra={"error": str(e), "response": str(response.response)})
-                response.extra = Status()
-        else:
-            _log.error(f"Got k8s API error with not a valid json. {empty_status_err}",
-                          extra={"response": str(response.response)})
-            response.extra = Status()
+        if not isinstance(response.response, dict):
+            _log.error(f"Got k8s API error with not a valid json. {_EMPTY_STATUS_ERR}",
+                       extra={"response": str(response.response)})
+        response.load_extra_lazily(_status_from_error_response)
         return response
     api, kind = response.get("apiVersion"), response.get("kind")
     k8s_model = get_model(api, kind)
@@ -597,6 +651,67 @@ async def get_k8s_resource(
             raise __decode_k8s_rest_api_response(e)
         raise
 
+
+async def iter_k8s_resources(
+        resource: Type[ResourceT],
+        namespace: str = None,
+        *,
+        page_size: int = 500,
+        server: str = None,
+        params: K8sQueryParams = None,
+        headers: dict[str, str] = None,
+        processing: APIRequestProcessingConfig = DEFAULT_PROCESSING,
+        log: K8sAPIRequestLoggingConfig = DEFAULT_LOGGING
+) -> AsyncIterator[ResourceT]:
+    """
+    List resources page by page following the `continue` token, yielding items as pages arrive.
+    The whole list is never held in memory, and the next page is only requested once the caller
+    has consumed the current one, so listing can't run ahead of the processing.
+    """
+    params = replace(params or K8sQueryParams(), limit=page_size)
+    while True:
+        page = await get_k8s_resource(
+            resource, namespace=namespace, server=server, params=params, headers=headers, processing=processing,
+            log=log)
+        for item in page.items:
+            yield item
+        continue_token = page.metadata.continue_ if page.metadata else None
+        if not continue_token:
+            return
+        params = replace(params, _continue=continue_token)
+
+
+async def count_k8s_resources(
+        resource: Type[ResourceT],
+        namespace: str = None,
+        *,
+        page_size: int = 500,
+        server: str = None,
+        params: K8sQueryParams = None,
+        headers: dict[str, str] = None,
+        processing: APIRequestProcessingConfig = DEFAULT_PROCESSING,
+        log: K8sAPIRequestLoggingConfig = DEFAULT_LOGGING
+) -> int:
+    """
+    Count resources without downloading and decoding all of them. A single item is requested,
+    and the rest is taken from `metadata.remainingItemCount`. The API server omits it for some lists
+    (e.g. filtered by a selector), then we fall back to counting the rest page by page from the first
+    page's `continue` token, which costs a full LIST.
+    """
+    params = replace(params or K8sQueryParams(), limit=1, _continue=None)
+    count = 0
+    while True:
+        page = await get_k8s_resource(
+            resource, namespace=namespace, server=server, params=params, headers=headers, processing=processing,
+            log=log)
+        count += len(page.items)
+        continue_token = page.metadata.continue_ if page.metadata else None
+        if not continue_token:
+            return count
+        if page.metadata.remainingItemCount is not None:
+            return count + page.metadata.remainingItemCount
+        params = replace(params, limit=page_size, _continue=continue_token)
+
 #
 # CREATE
 #
@@ -675,6 +790,9 @@ async def create_k8s_resource(
 #
 # UPDATE
 #
+_UPDATE_PATCH_TYPES = frozenset({PatchRequestType.strategic_merge, PatchRequestType.merge, PatchRequestType.json})
+
+
 def _normalize_pointer(ptr: str) -> str:
     return "/" + "/".join([s for s in (ptr or "").split("/") if s])
 
@@ -756,6 +874,19 @@ def _build_partial_spec_for_paths(resource: K8sResource, paths: list[PathPicker[
     return partial
 
 
+def _merge_patch_from_json_patch(new_doc: dict[str, Any], json_patch: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Build a merge-patch body covering the paths changed by a JSON Patch.
+    Removed keys are set to null, a change inside a list sets the entire list (list root promotion).
+    """
+    partial: dict[str, Any] = {}
+    for op in json_patch:
+        segments = [s.replace("~1", "/").replace("~0", "~") for s in op["path"].split("/")[1:]]
+        merge_root = _find_merge_root_segments(new_doc, segments)
+        _set_by_segments(partial, merge_root, _get_by_pointer(new_doc, merge_root))
+    return partial
+
+
 @overload
 async def update_k8s_resource(
         resource: ResourceT,
@@ -769,6 +900,8 @@ async def update_k8s_resource(
         paths: list[PathPicker] = None,
         force: bool = False,
         ignore_list_conflicts: bool = False,
+        pin_resource_version: bool = False,
+        patch_type: PatchRequestType | None = None,
         processing: APIRequestProcessingConfig = DEFAULT_PROCESSING,
         log: K8sAPIRequestLoggingConfig = DEFAULT_LOGGING,
         return_api_exceptions: Literal[None] = None
@@ -787,6 +920,8 @@ async def update_k8s_resource(
         paths: list[PathPicker] = None,
         force: bool = False,
         ignore_list_conflicts: bool = False,
+        pin_resource_version: bool = False,
+        patch_type: PatchRequestType | None = None,
         processing: APIRequestProcessingConfig = DEFAULT_PROCESSING,
         log: K8sAPIRequestLoggingConfig = DEFAULT_LOGGING,
         return_api_exceptions: Sequence[int | Type[RESTAPIError]] = None
@@ -804,14 +939,23 @@ async def update_k8s_resource(
         paths: list[PathPicker] = None,
         force: bool = False,
         ignore_list_conflicts: bool = False,
+        pin_resource_version: bool = False,
+        patch_type: PatchRequestType | None = None,
         processing: APIRequestProcessingConfig = DEFAULT_PROCESSING,
         log: K8sAPIRequestLoggingConfig = DEFAULT_LOGGING,
         return_api_exceptions: Sequence[int | Type[RESTAPIError]] = None
 ) -> ResourceT | Status | RESTAPIError[Status]:
 
-    # Do strategic merge if we can
+    # Do strategic merge if we can, unless the caller knows better
     method = HTTPMethod.PATCH
-    if PatchRequestType.strategic_merge in resource.patch_strategies_:
+    if patch_type is not None:
+        if patch_type not in _UPDATE_PATCH_TYPES:
+            raise ValueError(f"Unsupported patch_type for update: {patch_type}. "
+                             f"Use apply_k8s_resource for server-side apply")
+        if patch_type == PatchRequestType.json and not built_from_latest and not force:
+            raise ValueError("JSON Patch is computed as a diff, pass built_from_latest to use it")
+        content_type = patch_type
+    elif PatchRequestType.strategic_merge in resource.patch_strategies_:
         content_type = PatchRequestType.strategic_merge
     else:
         content_type = PatchRequestType.merge
@@ -842,16 +986,29 @@ async def update_k8s_resource(
             if not json_patch:
                 return built_from_latest
 
-            # Build strategic merge if we can
-            if content_type == PatchRequestType.strategic_merge:
-                request_data = jsonpatch_to_smp(built_from_latest, json_patch)
-            # Do jsonPatch otherwise
+            # Optimistic locking: the API server rejects the patch with 409 if the object changed since
+            #  `built_from_latest` was read, instead of silently merging over a concurrent write
+            latest_version = getattr(built_from_latest.metadata, "resourceVersion", None) \
+                if pin_resource_version else None
+
+            # Build strategic merge if we can, or a plain merge patch when it was asked for explicitly
+            if content_type == PatchRequestType.strategic_merge or patch_type == PatchRequestType.merge:
+                if content_type == PatchRequestType.strategic_merge:
+                    request_data = jsonpatch_to_smp(built_from_latest, json_patch)
+                else:
+                    request_data = _merge_patch_from_json_patch(new_dict, json_patch)
+                if latest_version:
+                    request_data.setdefault("metadata", {})["resourceVersion"] = latest_version
+            # Do jsonPatch otherwise: the smallest body, and the cheapest patch for the API server to apply
             else:
                 content_type = PatchRequestType.json
 
                 # Guard lists and list items from being forced via `test` directives
                 if not ignore_list_conflicts:
                     json_patch = guard_lists_from_json_patch_replacement(json_patch, old_dict)
+                if latest_version:
+                    json_patch = [{"op": "test", "path": "/metadata/resourceVersion", "value": latest_version},
+                                  *json_patch]
                 request_data = json_patch
 
         # If we know paths to merge, pick them all
@@ -893,6 +1050,168 @@ async def update_k8s_resource(
         raise
 
 
+#
+# APPLY
+#
+def _drop_nones(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _drop_nones(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_drop_nones(v) for v in value]
+    return value
+
+
+@overload
+async def apply_k8s_resource(
+        resource: ResourceT,
+        name: str | None = None,
+        namespace: str | None = None,
+        *,
+        field_manager: str,
+        force: bool = False,
+        server: str = None,
+        params: K8sQueryParams = None,
+        headers: dict[str, str] = None,
+        processing: APIRequestProcessingConfig = DEFAULT_PROCESSING,
+        log: K8sAPIRequestLoggingConfig = DEFAULT_LOGGING,
+        return_api_exceptions: Literal[None] = None
+) -> ResourceT | Status: ...
+
+@overload
+async def apply_k8s_resource(
+        resource: ResourceT,
+        name: str | None = None,
+        namespace: str | None = None,
+        *,
+        field_manager: str,
+        force: bool = False,
+        server: str = None,
+        params: K8sQueryParams = None,
+        headers: dict[str, str] = None,
+        processing: APIRequestProcessingConfig = DEFAULT_PROCESSING,
+        log: K8sAPIRequestLoggingConfig = DEFAULT_LOGGING,
+        return_api_exceptions: Sequence[int | Type[RESTAPIError]] = None
+) -> ResourceT | Status | RESTAPIError[Status]: ...
+
+async def apply_k8s_resource(
+        resource: ResourceT,
+        name: str | None = None,
+        namespace: str | None = None,
+        *,
+        field_manager: str,
+        force: bool = False,
+        server: str = None,
+        params: K8sQueryParams = None,
+        headers: dict[str, str] = None,
+        processing: APIRequestProcessingConfig = DEFAULT_PROCESSING,
+        log: K8sAPIRequestLoggingConfig = DEFAULT_LOGGING,
+        return_api_exceptions: Sequence[int | Type[RESTAPIError]] = None
+) -> ResourceT | Status | RESTAPIError[Status]:
+    """
+    Server-Side Apply. Send only the fields `field_manager` owns and let the API server merge them,
+    so there is no need to read the object first. Creates the resource if it does not exist.
+    With `force=True` conflicting fields are taken over from other managers.
+    """
+    method = HTTPMethod.PATCH
+    name = name or getattr(resource.metadata, "name", None)
+    namespace = namespace or getattr(resource.metadata, "namespace", None)
+    if not name:
+        raise ValueError(f"Resource name is required to apply {resource.apiVersion} {resource.kind}")
+    params = replace(params or K8sQueryParams(), fieldManager=field_manager, force=force or None)
+    try:
+        response = await rest_api_request(
+            method=method,
+            url=f"{server.strip('/') if server else ''}/{__build_request_url(resource, name, namespace)}",
+            params=params.to_http_params(),
+            headers=(headers or {}) | {"Content-Type": PatchRequestType.server_side},
+            data=_drop_nones(resource.to_dict()),
+            processing=processing,
+            log=log,
+            return_api_exceptions=return_api_exceptions
+        )
+        return __decode_k8s_rest_api_response(response)
+    except Exception as e:
+        if log.errors_as_critical or isinstance(e, TypeError):
+            _log.critical(f"Error happened while attempting to apply resource {resource.apiVersion}: {e}")
+        if isinstance(e, RESTAPIError):
+            raise __decode_k8s_rest_api_response(e)
+        raise
+
+
+#
+# SCALE
+#
+@overload
+async def scale_k8s_resource(
+        resource: Type[ResourceT] | ResourceT,
+        name: str = None,
+        namespace: str = None,
+        *,
+        replicas: int,
+        server: str = None,
+        params: K8sQueryParams = None,
+        headers: dict[str, str] = None,
+        processing: APIRequestProcessingConfig = DEFAULT_PROCESSING,
+        log: K8sAPIRequestLoggingConfig = DEFAULT_LOGGING,
+        return_api_exceptions: Literal[None] = None
+) -> Scale: ...
+
+@overload
+async def scale_k8s_resource(
+        resource: Type[ResourceT] | ResourceT,
+        name: str = None,
+        namespace: str = None,
+        *,
+        replicas: int,
+        server: str = None,
+        params: K8sQueryParams = None,
+        headers: dict[str, str] = None,
+        processing: APIRequestProcessingConfig = DEFAULT_PROCESSING,
+        log: K8sAPIRequestLoggingConfig = DEFAULT_LOGGING,
+        return_api_exceptions: Sequence[int | Type[RESTAPIError]] = None
+) -> Scale | RESTAPIError[Status]: ...
+
+async def scale_k8s_resource(
+        resource: Type[ResourceT] | ResourceT,
+        name: str = None,
+        namespace: str = None,
+        *,
+        replicas: int,
+        server: str = None,
+        params: K8sQueryParams = None,
+        headers: dict[str, str] = None,
+        processing: APIRequestProcessingConfig = DEFAULT_PROCESSING,
+        log: K8sAPIRequestLoggingConfig = DEFAULT_LOGGING,
+        return_api_exceptions: Sequence[int | Type[RESTAPIError]] = None
+) -> Scale | RESTAPIError[Status]:
+    """
+    Set replicas via the `/scale` subresource. No need to read the whole object first,
+    only a tiny merge patch is sent and the `autoscaling/v1 Scale` object is returned.
+    """
+    method = HTTPMethod.PATCH
+    name = name or (None if isclass(resource) else resource.metadata.name)
+    if not name:
+        raise ValueError(f"Resource name is required to scale {resource.apiVersion} {resource.kind}")
+    try:
+        response = await rest_api_request(
+            method=method,
+            url=f"{server.strip('/') if server else ''}/{__build_request_url(resource, name, namespace)}/scale",
+            params=params.to_http_params() if params else None,
+            headers=(headers or {}) | {"Content-Type": PatchRequestType.merge},
+            data={"spec": {"replicas": replicas}},
+            processing=processing,
+            log=log,
+            return_api_exceptions=return_api_exceptions
+        )
+        return __decode_k8s_rest_api_response(response)
+    except Exception as e:
+        if log.errors_as_critical or isinstance(e, TypeError):
+            _log.critical(f"Error happened while attempting to {method} resource {resource.apiVersion} scale: {e}")
+        if isinstance(e, RESTAPIError):
+            raise __decode_k8s_rest_api_response(e)
+        raise
+
+
 #
 # DELETE
 #
@@ -1076,6 +1395,9 @@ async def watch_k8s_resources(
     Example:
         async for event in watch_k8s_resources(Pod, namespace="default"):
             print(event.type, event.object.metadata.name)
+
+    BOOKMARK events are sent by the API server only when `params.allowWatchBookmarks` is True,
+    so there is no need to filter them out otherwise.
     """
     method = HTTPMethod.GET
     params = params or K8sQueryParams()
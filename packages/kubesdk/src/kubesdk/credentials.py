@@ -172,6 +172,27 @@ class Vault(AsyncIterable[tuple[VaultKey, ConnectionInfo]]):
                         item.caches[purpose] = factory(item.info)
             yield key, item.info, cast(_T, item.caches[purpose])
 
+    def cached(
+            self,
+            purpose: str,
+    ) -> tuple[VaultKey, ConnectionInfo, object] | None:
+        """
+        Select an item and return it with its cached object, if both can be used right away.
+
+        This is a lock-free shortcut of `extended` for the steady state: the vault is ready,
+        nothing is due to expire, and the object for the purpose is already created.
+        Otherwise, None is returned, and the caller should go through `extended`
+        to wait for re-authentication or to create the object.
+        """
+        if not self._ready or not self._current:
+            return None
+        if self._next_expiration is not None and datetime.now(timezone.utc) >= self._next_expiration:
+            return None
+        key, item = self.select()
+        if item.caches is None or purpose not in item.caches:
+            return None
+        return key, item.info, item.caches[purpose]
+
     async def _items(
             self,
     ) -> AsyncIterator[tuple[VaultKey, VaultItem]]:
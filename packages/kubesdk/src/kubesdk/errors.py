@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar
+from typing import Generic, TypeVar, Callable, Any
 
 _ErrorExtraT = TypeVar('_ErrorExtraT')
 
@@ -9,7 +9,8 @@ class RESTAPIError(Exception, Generic[_ErrorExtraT]):
     status: int
     _message: str
     response: dict | str
-    extra: _ErrorExtraT | None
+    _extra: _ErrorExtraT | None
+    _extra_loader: Callable[[Any], _ErrorExtraT] | None
 
     def __init__(self, status: int = None, message: str = None, response: dict | str = None,
                  api_name: str = "Kubernetes", extra: _ErrorExtraT = None):
@@ -20,6 +21,20 @@ class RESTAPIError(Exception, Generic[_ErrorExtraT]):
         self.api_name = api_name
         self.extra = extra
 
+    @property
+    def extra(self) -> _ErrorExtraT | None:
+        if self._extra_loader is not None:
+            self._extra, self._extra_loader = self._extra_loader(self.response), None
+        return self._extra
+
+    @extra.setter
+    def extra(self, value: _ErrorExtraT | None) -> None:
+        self._extra, self._extra_loader = value, None
+
+    def load_extra_lazily(self, loader: Callable[[Any], _ErrorExtraT]) -> None:
+        """Build `extra` from the response on first access only. Most callers check the error type and never read it."""
+        self._extra, self._extra_loader = None, loader
+
     def __str__(self): return f"{self.api_name} Error {self.status}: {self._message}. Response: {self.response}"
 
 
@@ -1,8 +1,11 @@
 import asyncio
+import contextvars
+import time
 import unittest
+from unittest import mock
 from typing import AsyncIterator, Any
 
-from kubesdk._auth import APIContext
+from kubesdk._auth import APIContext, GlobalContextVar, _vault_key, _ssl_context, DEFAULT_VAULT_NAME
 from kubesdk.credentials import ConnectionInfo, ServerInfo, ClientInfo
 
 
@@ -13,6 +16,10 @@ class FakeSession:
     """
     def __init__(self) -> None:
         self.requests: list[tuple[str, str]] = []
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
 
     async def request(self, method: str, url: str, **kwargs: Any) -> tuple[str, str]:
         self.requests.append((method, url))
@@ -74,6 +81,23 @@ class TestAPIContext(unittest.TestCase):
 
         self._run(scenario())
 
+    def test_nested_call_on_worker_loop_skips_thread_hop(self) -> None:
+        async def outer_call(*, _context: APIContext) -> int:
+            return await _context.call(fake_async_call)
+
+        async def scenario():
+            ctx = self._make_ctx()
+            try:
+                with mock.patch("kubesdk._auth.asyncio.run_coroutine_threadsafe",
+                                wraps=asyncio.run_coroutine_threadsafe) as hop:
+                    self.assertEqual(await ctx.call(outer_call), 123)
+                self.assertEqual(hop.call_count, 1)
+                self.assertEqual(ctx._workers[0]._sessions[0].requests, [("GET", "/ping")])
+            finally:
+                ctx.close()
+
+        self._run(scenario())
+
     def test_watch_generator_basic(self) -> None:
         """
         Generator path: we should see all yielded items in order.
@@ -92,3 +116,95 @@ class TestAPIContext(unittest.TestCase):
                     ctx.close()
 
         self._run(scenario())
+
+    def test_close_closes_stream_clients(self) -> None:
+        """
+        Per-loop stream clients must be closed on close(), not leaked.
+        """
+        async def scenario():
+            ctx = self._make_ctx()
+            agen = await ctx.call(fake_watch, 3)
+            self.assertEqual([x async for x in agen], [0, 1, 2])
+            stream_client = next(iter(ctx._stream_clients.values()))
+
+            ctx.close()
+            await asyncio.sleep(0.05)
+            self.assertTrue(stream_client.closed)
+            self.assertEqual(ctx._stream_clients, {})
+
+        self._run(scenario())
+
+    def test_close_right_after_start(self) -> None:
+        for _ in range(5):
+            ctx = self._make_ctx()
+            started = time.monotonic()
+            ctx.close()
+            self.assertLess(time.monotonic() - started, 1)
+            self.assertFalse(ctx._workers[0]._thread.is_alive())
+
+    def test_round_robin_over_all_sessions(self) -> None:
+        info = ConnectionInfo(server_info=ServerInfo(server="localhost"), client_info=ClientInfo())
+        ctx = APIContext(info=info, pool_size=2, threads=2, session_factory=fake_session_factory)
+        try:
+            picked = [ctx._choose_address() for _ in range(8)]
+            self.assertEqual(picked[:4], [(0, 0), (0, 1), (1, 0), (1, 1)])
+            self.assertEqual(picked[4:], picked[:4])
+        finally:
+            ctx.close()
+
+
+class TestVaultKey(unittest.TestCase):
+    def test_matches_host_from_url(self) -> None:
+        self.assertEqual(_vault_key("https://10.0.0.1:6443/api/v1/namespaces/default/pods"), "10.0.0.1:6443")
+        self.assertEqual(_vault_key("https://10.0.0.1:6443"), "10.0.0.1:6443")
+        self.assertEqual(_vault_key("//cluster.local/api"), "cluster.local")
+        self.assertEqual(_vault_key("cluster.local:6443/api"), "cluster.local:6443")
+
+    def test_path_only_goes_to_default_vault(self) -> None:
+        self.assertEqual(_vault_key("/api/v1/pods"), DEFAULT_VAULT_NAME)
+        self.assertEqual(_vault_key(None), DEFAULT_VAULT_NAME)
+        self.assertEqual(_vault_key(""), DEFAULT_VAULT_NAME)
+
+
+class TestDefaultSessionFactory(unittest.TestCase):
+    def test_worker_sessions_share_connector(self) -> None:
+        async def scenario():
+            info = ConnectionInfo(server_info=ServerInfo(server="https://localhost:6443"), client_info=ClientInfo())
+            ctx = APIContext(info=info, pool_size=3, threads=2)
+            try:
+                connectors = []
+                for worker in ctx._workers:
+                    sessions = worker.sessions
+                    self.assertEqual(len({id(s.connector) for s in sessions}), 1)
+                    self.assertEqual([s.connector_owner for s in sessions], [True, False, False])
+                    connectors.append(sessions[0].connector)
+                self.assertIsNot(connectors[0], connectors[1])
+            finally:
+                ctx.close()
+            self.assertTrue(all(c.closed for c in connectors))
+
+        asyncio.run(scenario())
+
+
+class TestGlobalContextVar(unittest.TestCase):
+    def test_unset_raises_lookup_error(self) -> None:
+        with self.assertRaises(LookupError):
+            GlobalContextVar("unset").get()
+
+    def test_falls_back_to_global_value(self) -> None:
+        var = GlobalContextVar("fallback")
+        var.set("global")
+
+        # A fresh context has no local value, like a thread started before set()
+        self.assertEqual(contextvars.Context().run(var.get), "global")
+
+
+class TestSSLContext(unittest.TestCase):
+    def test_reused_for_same_files(self) -> None:
+        self.assertIs(_ssl_context(None, None, None, False), _ssl_context(None, None, None, False))
+
+    def test_insecure_gets_own_context(self) -> None:
+        secure, insecure = _ssl_context(None, None, None, False), _ssl_context(None, None, None, True)
+        self.assertIsNot(secure, insecure)
+        self.assertTrue(secure.check_hostname)
+        self.assertFalse(insecure.check_hostname)
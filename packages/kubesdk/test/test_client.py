@@ -1,9 +1,23 @@
+import asyncio
 import unittest
 from enum import Enum
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest import mock
+
+from kube_models.const import PatchRequestType
+from kube_models.api_v1.io.k8s.api.core.v1 import ConfigMap, Namespace
+from kube_models.api_v1.io.k8s.apimachinery.pkg.apis.meta.v1 import ObjectMeta
+from kube_models.api_v1.io.k8s.api.autoscaling.v1 import Scale
+from kube_models.apis_apps_v1.io.k8s.api.apps.v1 import Deployment
 
 # Use package-level import to not miss anything in __init__
 from kubesdk import QueryLabelSelector, QueryLabelSelectorRequirement, LabelSelectorOp, \
-    FieldSelectorRequirement, FieldSelectorOp, FieldSelector, K8sQueryParams, DryRun, PropagationPolicy
+    FieldSelectorRequirement, FieldSelectorOp, FieldSelector, K8sQueryParams, DryRun, PropagationPolicy, \
+    APIRequestProcessingConfig, ServiceUnavailableError, ServerTimeoutError, NotFoundError, update_k8s_resource, \
+    scale_k8s_resource
+from kubesdk import client
+from kubesdk.client import _drop_nones, _pins_resource_version
 
 
 class TestQueryLabelSelector(unittest.TestCase):
@@ -170,3 +184,247 @@ class TestK8sQueryParams(unittest.TestCase):
                 ("labelSelector", "app=nginx")
             ],
         )
+
+
+class TestAPIRequestProcessingConfig(unittest.TestCase):
+    def test_should_retry_by_code_and_error_type(self):
+        cfg = APIRequestProcessingConfig(retry_statuses=[502, ServiceUnavailableError])
+        self.assertTrue(cfg.should_retry(502, None))
+        self.assertTrue(cfg.should_retry(503, ServiceUnavailableError))
+        self.assertFalse(cfg.should_retry(504, ServerTimeoutError))
+        self.assertFalse(cfg.should_retry(200, None))
+
+    def test_replace_rebuilds_retry_set(self):
+        cfg = replace(APIRequestProcessingConfig(retry_statuses=[502]), retry_statuses=(504,))
+        self.assertTrue(cfg.should_retry(504, ServerTimeoutError))
+        self.assertFalse(cfg.should_retry(502, None))
+
+    def test_backoff_interval_forms(self):
+        self.assertEqual(APIRequestProcessingConfig(backoff_interval=7).backoff(3), 7)
+        self.assertEqual(APIRequestProcessingConfig(backoff_interval=0.5).backoff(3), 0.5)
+        self.assertEqual(APIRequestProcessingConfig(backoff_interval=lambda a: 2 ** a).backoff(3), 8)
+        table = APIRequestProcessingConfig(backoff_interval=(1, 2, 4))
+        self.assertEqual([table.backoff(a) for a in range(1, 6)], [1, 2, 4, 4, 4])
+        float_table = APIRequestProcessingConfig(backoff_interval=[0.1, 0.5])
+        self.assertEqual([float_table.backoff(a) for a in range(1, 4)], [0.1, 0.5, 0.5])
+        with self.assertRaises(ValueError):
+            APIRequestProcessingConfig(backoff_interval=())
+
+
+class TestRawAPIRequestRetries(unittest.TestCase):
+    def _run(self, statuses, data=None, **config):
+        responses = iter(statuses)
+        calls, sleeps = [], []
+
+        class FakeResponse:
+            def __init__(self, status): self.status = status
+            async def read(self): return b""
+            def release(self): pass
+
+        async def fake_request(method, url, **kwargs):
+            calls.append(kwargs["json"])
+            return FakeResponse(next(responses))
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        session = SimpleNamespace(request=fake_request)
+        processing = APIRequestProcessingConfig(**config)
+        with mock.patch.object(client.asyncio, "sleep", fake_sleep):
+            response = asyncio.run(client._raw_api_request("PATCH", "/x", session, data=data, processing=processing))
+        return response.status, calls, sleeps
+
+    def test_sleeps_follow_backoff_table(self):
+        status, calls, sleeps = self._run(
+            [503, 503, 503, 200], backoff_limit=4, backoff_interval=[0.1, 0.5], retry_statuses=[503])
+        self.assertEqual(status, 200)
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(sleeps, [0.1, 0.5, 0.5])
+
+    def test_last_attempt_is_not_retried(self):
+        status, calls, sleeps = self._run([503, 503, 200], backoff_limit=2, backoff_interval=0, retry_statuses=[503])
+        self.assertEqual(status, 503)
+        self.assertEqual(len(calls), 2)
+
+    def _conflict_calls(self, data):
+        status, calls, _ = self._run([409, 200], data=data, backoff_limit=3, backoff_interval=0, retry_statuses=[409])
+        return status, len(calls)
+
+    def test_pinned_conflict_is_not_retried(self):
+        self.assertEqual(self._conflict_calls({"metadata": {"resourceVersion": "7"}}), (409, 1))
+        self.assertEqual(
+            self._conflict_calls([{"op": "test", "path": "/metadata/resourceVersion", "value": "7"}]), (409, 1))
+
+    def test_unpinned_conflict_is_retried(self):
+        self.assertEqual(self._conflict_calls({"data": {"a": "1"}}), (200, 2))
+
+
+class TestDropNones(unittest.TestCase):
+    def test_nested(self):
+        self.assertEqual(
+            _drop_nones({"a": None, "b": {"c": None, "d": 1}, "e": [{"f": None, "g": 2}], "h": []}),
+            {"b": {"d": 1}, "e": [{"g": 2}], "h": []})
+
+
+class TestIterK8sResources(unittest.TestCase):
+    def test_follows_continue_token(self):
+
+        pages = {
+            None: SimpleNamespace(items=[1, 2], metadata=SimpleNamespace(continue_="next")),
+            "next": SimpleNamespace(items=[3], metadata=SimpleNamespace(continue_=None)),
+        }
+        seen_params = []
+
+        async def fake_get(resource, namespace=None, *, params=None, **kwargs):
+            seen_params.append(params)
+            return pages[params._continue]
+
+        async def collect():
+            return [item async for item in client.iter_k8s_resources(object, "ns", page_size=2)]
+
+        with mock.patch.object(client, "get_k8s_resource", fake_get):
+            self.assertEqual(asyncio.run(collect()), [1, 2, 3])
+        self.assertEqual([p.limit for p in seen_params], [2, 2])
+
+
+class TestCountK8sResources(unittest.TestCase):
+    def _count(self, pages):
+        calls = []
+
+        async def fake_get(resource, namespace=None, *, params=None, **kwargs):
+            calls.append(params)
+            return pages[params._continue]
+
+        with mock.patch.object(client, "get_k8s_resource", fake_get):
+            return asyncio.run(client.count_k8s_resources(object, "ns")), calls
+
+    def test_uses_remaining_item_count(self):
+        count, calls = self._count({
+            None: SimpleNamespace(items=[1], metadata=SimpleNamespace(continue_="next", remainingItemCount=41))})
+        self.assertEqual(count, 42)
+        self.assertEqual([p.limit for p in calls], [1])
+
+    def test_falls_back_to_paging(self):
+        count, calls = self._count({
+            None: SimpleNamespace(items=[1], metadata=SimpleNamespace(continue_="next", remainingItemCount=None)),
+            "next": SimpleNamespace(items=[2, 3], metadata=SimpleNamespace(continue_=None, remainingItemCount=None))})
+        self.assertEqual(count, 3)
+        # The fallback continues from the first page instead of listing everything again
+        self.assertEqual([(p.limit, p._continue) for p in calls], [(1, None), (500, "next")])
+
+
+class TestUpdatePatchType(unittest.TestCase):
+    def test_invalid_patch_type(self):
+
+        cm = ConfigMap(metadata=ObjectMeta(name="cm", namespace="default"))
+        with self.assertRaises(ValueError):
+            asyncio.run(update_k8s_resource(cm, patch_type=PatchRequestType.server_side))
+        with self.assertRaises(ValueError):
+            asyncio.run(update_k8s_resource(cm, patch_type=PatchRequestType.json))
+
+
+class TestPinsResourceVersion(unittest.TestCase):
+    def test_bodies(self):
+        self.assertTrue(_pins_resource_version({"metadata": {"name": "a", "resourceVersion": "42"}}))
+        self.assertFalse(_pins_resource_version({"metadata": {"name": "a", "resourceVersion": None}}))
+        self.assertFalse(_pins_resource_version({"spec": {"replicas": 1}}))
+        self.assertTrue(_pins_resource_version([
+            {"op": "test", "path": "/metadata/resourceVersion", "value": "42"},
+            {"op": "replace", "path": "/spec/replicas", "value": 2}]))
+        self.assertFalse(_pins_resource_version([{"op": "replace", "path": "/metadata/resourceVersion", "value": "1"}]))
+        self.assertFalse(_pins_resource_version(None))
+
+
+class TestUpdatePinResourceVersion(unittest.TestCase):
+    def _sent(self, data=None, **kwargs):
+        latest = ConfigMap(metadata=ObjectMeta(name="cm", namespace="default", resourceVersion="7"), data={"a": "1"})
+        updated = replace(latest, data=data or {"a": "2"})
+        sent = {}
+
+        async def fake_request(*, method, url, data, headers, **_):
+            sent["data"], sent["headers"] = data, headers
+            return latest.to_dict()
+
+        with mock.patch.object(client, "rest_api_request", fake_request):
+            asyncio.run(update_k8s_resource(updated, built_from_latest=latest, pin_resource_version=True, **kwargs))
+        return sent
+
+    def _sent_body(self, **kwargs):
+        return self._sent(**kwargs)["data"]
+
+    def test_strategic_merge_body_carries_version(self):
+        self.assertEqual(self._sent_body()["metadata"]["resourceVersion"], "7")
+
+    def test_json_patch_starts_with_version_test(self):
+        body = self._sent_body(patch_type=PatchRequestType.json)
+        self.assertEqual(body[0], {"op": "test", "path": "/metadata/resourceVersion", "value": "7"})
+        self.assertEqual(body[1:], [{"op": "replace", "path": "/data/a", "value": "2"}])
+
+    def test_explicit_merge_patch_is_honored(self):
+        sent = self._sent(data={"b": "2"}, patch_type=PatchRequestType.merge)
+        self.assertEqual(sent["headers"]["Content-Type"], PatchRequestType.merge)
+        self.assertEqual(sent["data"], {"data": {"a": None, "b": "2"}, "metadata": {"resourceVersion": "7"}})
+
+
+class TestScaleK8sResource(unittest.TestCase):
+    def test_patches_scale_subresource(self):
+        sent = {}
+
+        async def fake_request(*, method, url, headers, data, **_):
+            sent.update(method=method, url=url, headers=headers, data=data)
+            return {"apiVersion": "autoscaling/v1", "kind": "Scale",
+                    "metadata": {"name": "d", "namespace": "ns"}, "spec": {"replicas": 3}}
+
+        with mock.patch.object(client, "rest_api_request", fake_request):
+            scale = asyncio.run(scale_k8s_resource(Deployment, "d", "ns", replicas=3))
+
+        self.assertEqual(sent["method"], "PATCH")
+        self.assertEqual(sent["url"], "/apis/apps/v1/namespaces/ns/deployments/d/scale")
+        self.assertEqual(sent["headers"]["Content-Type"], PatchRequestType.merge)
+        self.assertEqual(sent["data"], {"spec": {"replicas": 3}})
+        self.assertIsInstance(scale, Scale)
+        self.assertEqual(scale.spec.replicas, 3)
+
+    def test_name_required_for_class(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(scale_k8s_resource(Deployment, namespace="ns", replicas=1))
+
+
+class TestLazyErrorExtra(unittest.TestCase):
+    def test_status_decoded_on_first_access_only(self):
+        calls = []
+
+        def loader(response):
+            calls.append(response)
+            return client._status_from_error_response(response)
+
+        err = NotFoundError(404, "not found", {"apiVersion": "v1", "kind": "Status", "code": 404, "reason": "NotFound"})
+        err.load_extra_lazily(loader)
+        self.assertEqual(calls, [])
+        self.assertEqual(err.extra.reason, "NotFound")
+        self.assertIs(err.extra, err.extra)
+        self.assertEqual(len(calls), 1)
+
+        err.extra = None
+        self.assertIsNone(err.extra)
+
+    def test_invalid_json_logged_when_decoded(self):
+        decode = getattr(client, "__decode_k8s_rest_api_response")
+        with self.assertLogs(client._log, "ERROR") as logs:
+            err = decode(NotFoundError(404, "not found", "<html>"))
+        self.assertIn("not a valid json", logs.output[0])
+        with self.assertNoLogs(client._log):
+            self.assertIsNone(err.extra.code)
+
+
+class TestBuildRequestUrl(unittest.TestCase):
+    def test_namespaced_and_cluster_scoped(self):
+        build = getattr(client, "__build_request_url")
+
+        self.assertEqual(build(ConfigMap, "cm", "ns"), "api/v1/namespaces/ns/configmaps/cm")
+        self.assertEqual(build(ConfigMap), "api/v1/configmaps")
+        self.assertEqual(build(ConfigMap(metadata=ObjectMeta(name="cm", namespace="ns")), trim_name=True),
+                         "api/v1/namespaces/ns/configmaps")
+        self.assertEqual(build(Namespace, "ns"), "api/v1/namespaces/ns")
+        with self.assertRaises(ValueError):
+            build(Namespace, "ns", "other")
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 
 from kubesdk.common import *
@@ -111,3 +112,38 @@ class TestNormalizeDictKeys(unittest.TestCase):
         # original object not modified (no in-place changes)
         self.assertIn("simple-key", original)
         self.assertIn("nested-list", original)
+
+
+class TestJsonDumps(unittest.TestCase):
+    def test_compact_and_equal_to_stdlib(self):
+        body = {"metadata": {"name": "x", "labels": {"a": "b"}}, "spec": {"replicas": 2, "items": [1, None, True]}}
+        dumped = json_dumps(body)
+        self.assertIsInstance(dumped, str)
+        self.assertEqual(dumped, json.dumps(body, separators=(",", ":")))
+
+    def test_loads_roundtrip_and_errors(self):
+        body = {"kind": "Status", "details": {"causes": [{"field": "ü"}]}}
+        self.assertEqual(json_loads(json_dumps(body)), body)
+        self.assertEqual(json_loads(json_dumps(body).encode("utf-8")), body)
+        with self.assertRaises(json.JSONDecodeError):
+            json_loads(b"{not json")
+
+
+class TestGatherBounded(unittest.TestCase):
+    def test_limit_and_order(self):
+        in_flight, peak = 0, 0
+
+        async def job(i):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001 * (10 - i))
+            in_flight -= 1
+            return i
+
+        self.assertEqual(asyncio.run(gather_bounded((job(i) for i in range(10)), limit=3)), list(range(10)))
+        self.assertEqual(peak, 3)
+
+    def test_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(gather_bounded([], limit=0))
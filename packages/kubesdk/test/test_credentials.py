@@ -0,0 +1,37 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from kubesdk.credentials import Vault, ConnectionInfo, ServerInfo, ClientInfo
+
+
+def _info(**kwargs) -> ConnectionInfo:
+    return ConnectionInfo(server_info=ServerInfo(server="https://localhost:6443"), client_info=ClientInfo(), **kwargs)
+
+
+class TestVaultCached(unittest.TestCase):
+    def test_none_until_object_is_created(self):
+        async def scenario():
+            info = _info()
+            vault = Vault({"default": info})
+            self.assertIsNone(vault.cached("context"))
+
+            async for key, _, obj in vault.extended(lambda _: object(), "context"):
+                break
+            self.assertEqual(vault.cached("context"), (key, info, obj))
+            self.assertIsNone(vault.cached("other"))
+
+        asyncio.run(scenario())
+
+    def test_none_for_empty_or_expiring_vault(self):
+        async def scenario():
+            self.assertIsNone(Vault().cached("context"))
+
+            expired = _info(expiration=datetime.now(timezone.utc) - timedelta(seconds=1))
+            valid = _info(expiration=datetime.now(timezone.utc) + timedelta(hours=1))
+            vault = Vault({"expired": expired, "valid": valid})
+            for item in vault._current.values():
+                item.caches = {"context": object()}
+            self.assertIsNone(vault.cached("context"))
+
+        asyncio.run(scenario())
@@ -3,8 +3,8 @@
 import unittest
 import json
 from kubesdk._patch.json_patch import json_patch_from_diff, apply_patch, escape_json_path_pointer_token, \
-    _parse_pointer, JsonPointerError, _join_path, JsonPatchTestFailed, guard_lists_from_json_patch_replacement, \
-    _list_item_roots_for_path, _get_at_pointer, _resolve_parent, _flatten_leaves
+    _parse_pointer, _parse_pointer_cached, JsonPointerError, _join_path, JsonPatchTestFailed, \
+    guard_lists_from_json_patch_replacement, _list_item_roots_for_path, _get_at_pointer, _resolve_parent, _flatten_leaves
 
 class TestJsonPatchDiff(unittest.TestCase):
     def assertPatchTransforms(self, old, new):
@@ -43,6 +43,15 @@ class TestJsonPatchDiff(unittest.TestCase):
         new = ["a","c","e"]
         self.assertPatchTransforms(old, new)
 
+    def test_long_list_single_change(self):
+        old = [{"name": f"c{i}"} for i in range(300)]
+        new = old[:150] + [{"name": "changed"}] + old[151:]
+        self.assertEqual(json_patch_from_diff(old, new),
+                         [{"op": "replace", "path": "/150", "value": {"name": "changed"}}])
+        self.assertPatchTransforms(old, old + [{"name": "tail"}])
+        self.assertPatchTransforms(old, [{"name": "head"}] + old)
+        self.assertPatchTransforms([1, 1, 2, 1], [1, 2, 1, 1, 2])
+
     def test_type_change_at_root(self):
         old = {"a": 1}
         new = [ {"a": 1} ]
@@ -83,6 +92,16 @@ class TestJsonPatchDiff(unittest.TestCase):
         self.assertFalse(is_root)
         self.assertEqual(tokens, ["a","~","/", "3"])
 
+    def test_parse_pointer_cached(self):
+        first = _parse_pointer_cached("/spec/template/metadata/labels/app.kubernetes.io~1name")
+        self.assertIs(first, _parse_pointer_cached("/spec/template/metadata/labels/app.kubernetes.io~1name"))
+        self.assertEqual(first, (False, ("spec", "template", "metadata", "labels", "app.kubernetes.io/name")))
+
+        # Callers of the list form may mutate it without touching the cached tokens
+        _, tokens = _parse_pointer("/a/b")
+        tokens.append("c")
+        self.assertEqual(_parse_pointer("/a/b"), (False, ["a", "b"]))
+
     def test_idempotence(self):
         # applying diff twice shouldn't change the second time (patch of equal docs is empty)
         doc = {"a":[1,2,3],"b":{"c":1}}
@@ -466,6 +485,21 @@ class TestJsonPatchListGuards(unittest.TestCase):
             {"op": "replace", "path": "/spec/containers", "value": []},
         )
 
+    def test_guard_lists_scalar_list_root_single_test(self):
+        resource = {"spec": {"args": ["--a", "--b", "--c"], "empty": []}}
+        patch_ops = [
+            {"op": "replace", "path": "/spec/args", "value": ["--a"]},
+            {"op": "replace", "path": "/spec/args/1", "value": "--x"},
+            {"op": "replace", "path": "/spec/empty", "value": ["--y"]},
+        ]
+        guarded = guard_lists_from_json_patch_replacement(patch_ops, resource)
+        self.assertEqual([
+            {"op": "test", "path": "/spec/args", "value": ["--a", "--b", "--c"]},
+            patch_ops[0],
+            patch_ops[1],
+            patch_ops[2],
+        ], guarded)
+
     def test_guard_lists_duplicate_roots_and_weird_paths(self):
         resource = {
             "spec": {
@@ -214,6 +214,12 @@ class TestFromRootAndPath(unittest.TestCase):
         dummy = Dummy("val")
         self.assertEqual(picker.pick_(dummy), "val")
 
+    def test_shared_root_is_not_polluted(self):
+        class Dummy: ...
+
+        path_(from_root_(Dummy).spec.replicas)
+        self.assertEqual(path_(from_root_(Dummy).metadata).segments, ["metadata"])
+
     def test_path_with_custom_segments_object(self):
         # Custom object mimicking PathRoot by exposing _segments
         class CustomExpr:
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 import unittest
 
 from kubesdk._path.picker import PathPicker, PathResolutionError, path_, from_root_
-from kubesdk._path.replace_at_path import replace_
+from kubesdk._path.replace_at_path import replace_, replace_many_
 
 
 @dataclass(frozen=True)
@@ -335,3 +335,31 @@ class ReplaceTests(unittest.TestCase):
 
         # Right branch is reused (not cloned)
         self.assertIs(new_root.nodes["right"], root_obj.nodes["right"])
+
+    def test_replace_many_matches_chained_replace(self):
+        obj = OuterFrozen(inner=InnerFrozen(x=1, y=2))
+        x_path, y_path = path_(from_root_(OuterFrozen).inner.x), path_(from_root_(OuterFrozen).inner.y)
+
+        new_obj = replace_many_(obj, [(x_path, 10), (y_path, 20)])
+        self.assertEqual(new_obj, replace_(replace_(obj, x_path, 10), y_path, 20))
+        self.assertEqual(obj.inner, InnerFrozen(x=1, y=2))
+
+    def test_replace_many_later_change_wins(self):
+        obj = OuterFrozen(inner=InnerFrozen(x=1, y=2))
+        root = from_root_(OuterFrozen)
+
+        new_obj = replace_many_(obj, [
+            (path_(root.inner.x), 10),
+            (path_(root.inner), InnerFrozen(x=5, y=6)),
+            (path_(root.inner.y), 60),
+        ])
+        self.assertEqual(new_obj.inner, InnerFrozen(x=5, y=60))
+
+    def test_replace_many_mapping_and_empty(self):
+        obj = WithDictFrozen(data={"a": 1, "b": 2})
+        root = from_root_(WithDictFrozen)
+
+        new_obj = replace_many_(obj, [(path_(root.data["a"]), 10), (path_(root.data["b"]), 20)])
+        self.assertEqual(new_obj.data, {"a": 10, "b": 20})
+        self.assertEqual(obj.data, {"a": 1, "b": 2})
+        self.assertIs(replace_many_(obj, []), obj)
@@ -0,0 +1,39 @@
+import os
+import unittest
+
+from kubesdk._temp_files import _TempFiles
+
+
+class TestTempFiles(unittest.TestCase):
+    def test_same_content_is_shared_until_last_purge(self):
+        first, second = _TempFiles("_a"), _TempFiles("_b")
+        path = first[b"ca-data"]
+        self.assertEqual(path, second[b"ca-data"])
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"ca-data")
+
+        first.purge()
+        self.assertTrue(os.path.exists(path))
+        second.purge()
+        self.assertFalse(os.path.exists(path))
+
+    def test_different_content_gets_own_file(self):
+        files = _TempFiles("_c")
+        try:
+            self.assertNotEqual(files[b"cert"], files[b"key"])
+            self.assertEqual(len(files), 2)
+            self.assertEqual(sorted(files), [b"cert", b"key"])
+            self.assertEqual(files[bytes(b"cert")], files[b"cert"])
+        finally:
+            files.purge()
+
+    def test_removed_file_is_recreated(self):
+        first, second = _TempFiles("_d"), _TempFiles("_e")
+        try:
+            os.remove(first[b"stale"])
+            path = second[b"stale"]
+            self.assertTrue(os.path.exists(path))
+        finally:
+            first.purge()
+            second.purge()
+        self.assertFalse(os.path.exists(path))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 import functools
+import os
+import stat
 import sys
 import logging
 import asyncio
@@ -7,9 +9,15 @@ import ast
 import json
 from pathlib import Path
 import shutil
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
+try:
+    import orjson  # optional, parses large OpenAPI dumps noticeably faster
+except ImportError:
+    orjson = None
+
 from datamodel_code_generator import DataModelType, PythonVersion, LiteralType, OpenAPIScope
 
 # Our own extended parser
@@ -21,61 +29,56 @@ from kubesdk_cli.const import *
 logging.basicConfig(level=logging.DEBUG, force=True, handlers=[logging.StreamHandler(sys.stdout)])
 
 
+_DATACLASS_DECORATORS = frozenset({"dataclass"})
+
+
+def _decorator_name(dec: ast.expr) -> str | None:
+    """Terminal name of a decorator: `dataclass` for @dataclass, @dataclasses.dataclass and their calls."""
+    f = dec.func if isinstance(dec, ast.Call) else dec
+    if isinstance(f, ast.Name):
+        return f.id
+    if isinstance(f, ast.Attribute):
+        return f.attr
+    return None
+
+
 def _parse_exports_and_dataclasses(py_path: Path) -> tuple[set[str], set[str]]:
     """
     Returns (exports, dataclasses) for a module file:
       - exports: __all__ if present (literal list/tuple of strings), else public top-level names
       - dataclasses: class names decorated with @dataclass / @dataclass(...)
     """
-    src = py_path.read_text(encoding="utf-8")
-    tree = ast.parse(src, filename=str(py_path))
+    # Bytes go straight to the parser, which handles the source encoding itself
+    body = ast.parse(py_path.read_bytes(), filename=str(py_path)).body
 
     explicit_all: set[str] | None = None
     public: set[str] = set()
     dataclasses: set[str] = set()
 
-    # Fallback public names (no __all__): classes, funcs, assignments not starting with "_"
-    for node in tree.body:
+    # Single pass over the module body collecting:
+    #   - fallback public names (no __all__): classes, funcs, assignments not starting with "_"
+    #   - __all__ if literal list/tuple of strings
+    #   - dataclass names
+    for node in body:
         if isinstance(node, ast.Assign):
             for t in node.targets:
-                if isinstance(t, ast.Name) and not t.id.startswith("_"):
+                if not isinstance(t, ast.Name):
+                    continue
+                if not t.id.startswith("_"):
                     public.add(t.id)
+                elif t.id == "__all__" and isinstance(node.value, (ast.List, ast.Tuple)):
+                    explicit_all = {
+                        elt.value for elt in node.value.elts
+                        if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                    }
         elif isinstance(node, ast.AnnAssign):
             if isinstance(node.target, ast.Name) and not node.target.id.startswith("_"):
                 public.add(node.target.id)
         elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
             if not node.name.startswith("_"):
                 public.add(node.name)
-
-    # __all__ if literal list/tuple of strings
-    for node in tree.body:
-        if isinstance(node, ast.Assign):
-            for t in node.targets:
-                if isinstance(t, ast.Name) and t.id == "__all__":
-                    if isinstance(node.value, (ast.List, ast.Tuple)):
-                        names: list[str] = []
-                        for elt in node.value.elts:
-                            if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
-                                names.append(elt.value)
-                        explicit_all = set(names)
-
-    def _is_dataclass_dec(dec: ast.AST) -> bool:
-        # @dataclass or @dataclass(...)
-        if isinstance(dec, ast.Name):
-            return dec.id == "dataclass"
-        if isinstance(dec, ast.Attribute):
-            return dec.attr == "dataclass"
-        if isinstance(dec, ast.Call):
-            f = dec.func
-            if isinstance(f, ast.Name):
-                return f.id == "dataclass"
-            if isinstance(f, ast.Attribute):
-                return f.attr == "dataclass"
-        return False
-
-    for node in tree.body:
-        if isinstance(node, ast.ClassDef):
-            if any(_is_dataclass_dec(d) for d in node.decorator_list):
+            if isinstance(node, ast.ClassDef) and any(
+                    _decorator_name(d) in _DATACLASS_DECORATORS for d in node.decorator_list):
                 dataclasses.add(node.name)
 
     exports = explicit_all if explicit_all is not None else public
@@ -95,7 +98,8 @@ def write_inits(base_dir: str | Path, extra_globals: list[str] = None) -> None:
     import os  # local import to keep function self-contained
     base = Path(base_dir).expanduser().resolve()
 
-    extra_globals = extra_globals or []
+    # Not submodules of the package: skipped when collecting module files
+    excluded = frozenset(["__init__.py", *(extra_globals or [])])
     # loader_import: str = f"from {base.name}.loader import loader as __loader"
 
     for root, dirs, files in os.walk(base):
@@ -109,7 +113,7 @@ def write_inits(base_dir: str | Path, extra_globals: list[str] = None) -> None:
         # Child modules and subpackages
         module_paths = sorted(
             (pkg_dir / f) for f in files
-            if f.endswith(".py") and f not in ["__init__.py"] + [extra_file for extra_file in extra_globals])
+            if f.endswith(".py") and f not in excluded)
         subpkg_names = sorted(d for d in dirs if (pkg_dir / d / "__init__.py").exists())
 
         # Build explicit imports + wrap directives
@@ -144,9 +148,7 @@ def write_inits(base_dir: str | Path, extra_globals: list[str] = None) -> None:
 
         # Package __all__
         if all_exports:
-            seen = set()
-            unique = [n for n in all_exports if not (n in seen or seen.add(n))]
-            all_line = "__all__ = [" + ", ".join(f"'{n}'" for n in unique) + "]"
+            all_line = "__all__ = [" + ", ".join(f"'{n}'" for n in dict.fromkeys(all_exports)) + "]"
         else:
             # Skip this __init__ if there is nothing to export anyway
             continue
@@ -154,22 +156,15 @@ def write_inits(base_dir: str | Path, extra_globals: list[str] = None) -> None:
         # subpackage star imports
         subpkg_lines = [f"from .{sp} import *" for sp in subpkg_names]
 
-        # Precompute blocks to avoid backslashes in f-string expressions
-        imports_block = "\n".join(import_lines).rstrip()
-        wrap_exported_block = "\n".join(wrap_exported_lines).rstrip()
-        wrap_internal_block = "\n".join(wrap_internal_lines).rstrip()
-        subpkg_block = "\n".join(subpkg_lines).rstrip()
-
-        # Build final content
-        double_line = "\n\n"
-        content = f"""{GENERATED_HEADER}\
-{imports_block}\n\n
-{wrap_exported_block}\n
-{all_line + double_line if all_line else ""}\
-{wrap_internal_block + double_line if wrap_exported_block else ""}\
-{subpkg_block}\
-"""
-        init_path.write_text(content, encoding="utf-8")
+        # Build final content: non-empty blocks separated by a blank line, written at once
+        blocks = [import_lines, wrap_exported_lines, [all_line], wrap_internal_lines, subpkg_lines]
+        lines: list[str] = []
+        for block in blocks:
+            if block:
+                if lines:
+                    lines.append("")
+                lines.extend(block)
+        init_path.write_text(GENERATED_HEADER + "\n".join(lines) + "\n", encoding="utf-8")
 
 
 # ToDo: Move it into separate python file, need to solve dynamic meta import problem somehow
@@ -291,21 +286,28 @@ def is_openapi_v3_with_models(root: object) -> bool:
 def copy_file(src: Path, dst_dir: Path, new_name: str = None) -> Path:
     """Copy file `src` into directory `dst_dir`, returning the destination path."""
     new_name = new_name or src.name
-    if not src.is_file():
+    try:
+        is_file = stat.S_ISREG(os.stat(src).st_mode)
+    except OSError:
+        is_file = False
+    if not is_file:
         raise FileNotFoundError(f"Not a file: {src}")
     dst_dir.mkdir(parents=True, exist_ok=True)
     dst = dst_dir / new_name
-    shutil.copy2(src, dst)
+    # Contents only: templates need no metadata, and copyfile uses the fast kernel copy where available
+    shutil.copyfile(src, dst)
     return dst
 
 
 async def generate_for_schema(
         output: Path, python_version: PythonVersion, templates: Path, module_name: str,
-        from_file: Path = None, url: str = None, http_headers: dict[str, str] = None):
+        from_file: Path = None, url: str = None, http_headers: dict[str, str] = None, executor: Executor = None):
     input_ = urlparse(url) if url else from_file
     try:
         assert input_, "You must pass from_file path or OpenAPI schema url"
-        await asyncio.to_thread(functools.partial(
+        # Codegen is CPU-bound pure Python, so threads would serialize on the GIL: pass a process pool to run
+        # schemas in parallel. All arguments are picklable. Without executor, the loop's default one is used.
+        await asyncio.get_running_loop().run_in_executor(executor, functools.partial(
             generate,
             input_=input_,
             input_file_type=InputFileType.OpenAPIK8s,
@@ -373,24 +375,27 @@ async def generate_dataclasses_from_url(
     cluster_url = cluster_url.strip("/")
     manifest = fetch_open_api_manifest(cluster_url, http_headers)
 
-    tasks = []
-    for label, meta in sorted(manifest["paths"].items()):
-        url = f"{cluster_url}{meta.get('serverRelativeURL')}"
-        subdir = output / safe_module_name(label)
-        subdir.mkdir(parents=True, exist_ok=True)
-        (subdir / "__init__.py").touch(exist_ok=True)
-        tasks.append(
-            generate_for_schema(subdir.expanduser().resolve(), python_version, templates, module_name=module_name,
-                                url=url, http_headers=http_headers))
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        tasks = []
+        for label, meta in sorted(manifest["paths"].items()):
+            url = f"{cluster_url}{meta.get('serverRelativeURL')}"
+            subdir = output / safe_module_name(label)
+            subdir.mkdir(parents=True, exist_ok=True)
+            (subdir / "__init__.py").touch(exist_ok=True)
+            tasks.append(
+                generate_for_schema(subdir.expanduser().resolve(), python_version, templates, module_name=module_name,
+                                    url=url, http_headers=http_headers, executor=executor))
 
-    await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     # ToDo: Add k8s versioning to understand the range of compatible Kubernetes APIs for each model
 
 
 def read_all_json_files(from_dir: Path | str, recursive: bool = True) -> dict[str, dict]:
     pattern = "**/*.json" if recursive else "*.json"
-    return {f.name: json.loads(f.read_text(encoding="utf-8")) for f in Path(from_dir).glob(pattern) if f.is_file()}
+    # Bytes are parsed directly, without decoding to str first
+    loads = orjson.loads if orjson is not None else json.loads
+    return {f.name: loads(f.read_bytes()) for f in Path(from_dir).glob(pattern) if f.is_file()}
 
 
 async def generate_dataclasses_from_dir(
@@ -405,22 +410,24 @@ async def generate_dataclasses_from_dir(
     if not all_schemas:
         raise FileNotFoundError(f"No OpenAPI schemas found in {from_dir}")
 
-    tasks = []
-    for api_schema_file, meta in all_schemas.items():
-        try:
-            schema_root = min(meta.get("paths"))  # first path of the schema
-        except Exception:
-            logging.error(f"[skip] {from_dir / api_schema_file} is not a valid OpenAPI schema: unable to read paths")
-            continue
-
-        subdir = output / safe_module_name(schema_root)
-        subdir.mkdir(parents=True, exist_ok=True)
-        (subdir / "__init__.py").touch(exist_ok=True)
-        tasks.append(
-            generate_for_schema(subdir.expanduser().resolve(), python_version, templates, module_name=module_name,
-                                from_file=from_dir / api_schema_file))
-
-    await asyncio.gather(*tasks, return_exceptions=True)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        tasks = []
+        for api_schema_file, meta in all_schemas.items():
+            try:
+                schema_root = min(meta.get("paths"))  # first path of the schema
+            except Exception:
+                logging.error(
+                    f"[skip] {from_dir / api_schema_file} is not a valid OpenAPI schema: unable to read paths")
+                continue
+
+            subdir = output / safe_module_name(schema_root)
+            subdir.mkdir(parents=True, exist_ok=True)
+            (subdir / "__init__.py").touch(exist_ok=True)
+            tasks.append(
+                generate_for_schema(subdir.expanduser().resolve(), python_version, templates, module_name=module_name,
+                                    from_file=from_dir / api_schema_file, executor=executor))
+
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     # ToDo: Add k8s versioning to understand the range of compatible Kubernetes APIs for each model
 
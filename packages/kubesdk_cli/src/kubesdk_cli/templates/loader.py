@@ -6,6 +6,8 @@ import typing
 from datetime import datetime
 from base64 import b64encode
 import json
+from copy import deepcopy
+from enum import Enum
 from dataclasses import is_dataclass, fields, field, dataclass, Field
 from typing import *
 from types import UnionType
@@ -22,6 +24,9 @@ _CACHED_TYPES = {}
 _LOAD_TYPES_ON_INIT = "__should_load"
 _LOAD_LAZY_FIELD = "_lazy"
 _LAZY_SRC_FIELD = "_lazy_src"
+_TO_DICT_FIELDS = "__to_dict_fields"
+_IMMUTABLE_MODEL = "__immutable_model"
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, complex, bytes, type(None), datetime})
 
 
 def _supports_lazy_load(obj: Any) -> bool:
@@ -300,6 +305,59 @@ def _to_immutable(v: Any) -> Any:
         return repr(v)
 
 
+def _to_dict_fields(cls: type) -> Tuple[Tuple[str, Callable[[Any], Any] | None], ...]:
+    """
+    (name, encoder) pairs of the fields to_dict() should emit, resolved once per class.
+    Private fields and the ones flagged with 'exclude_from_dict' in metadata are skipped.
+    """
+    # Look into the class own __dict__ only, subclasses must not reuse the parent's fields
+    cached = cls.__dict__.get(_TO_DICT_FIELDS)
+    if cached is None:
+        cached = tuple(
+            (f.name, f.metadata.get("encoder")) for f in fields(cls)
+            if not f.name.startswith("_") and not f.metadata.get(EXCLUDE_FIELD_META_KEY))
+        setattr(cls, _TO_DICT_FIELDS, cached)
+    return cached
+
+
+def _is_immutable_type(tp: Any, seen: frozenset[type]) -> bool:
+    if tp in _IMMUTABLE_TYPES:
+        return True
+    origin = get_origin(tp)
+    if origin is Literal:
+        return True
+    if origin is Union or origin is UnionType:
+        return all(_is_immutable_type(arg, seen) for arg in get_args(tp))
+    if isinstance(tp, type):
+        if issubclass(tp, Enum):
+            return True
+        if issubclass(tp, Loadable):
+            return _is_immutable_model(tp, seen)
+    return False
+
+
+def _is_immutable_model(cls: type, seen: frozenset[type] = frozenset()) -> bool:
+    """
+    True if no public field of the model can hold a mutable value, so instances may be shared instead of copied.
+    Resolved once per class; self-referencing models and unresolvable hints are treated as mutable.
+    """
+    cached = cls.__dict__.get(_IMMUTABLE_MODEL)
+    if cached is not None:
+        return cached
+    if cls in seen:
+        return False
+    try:
+        hints = get_type_hints(cls, globalns=vars(sys.modules[cls.__module__]))
+    except Exception:
+        result = False
+    else:
+        seen = seen | {cls}
+        result = all(_is_immutable_type(hints.get(f.name, f.type), seen)
+                     for f in fields(cls) if not f.name.startswith("_"))
+    setattr(cls, _IMMUTABLE_MODEL, result)
+    return result
+
+
 class _LoadableMeta(type):
     """
     A metaclass for dataclasses to automatically decode fields during initialization
@@ -461,7 +519,7 @@ class Loadable(metaclass=_LoadableMeta):
 
     def __getstate__(self):
         """
-        Make deepcopy/pickle see realized state without implementing our own deepcopy.
+        Make deepcopy/pickle see realized state.
         """
         self._realize_all()
 
@@ -477,6 +535,16 @@ class Loadable(metaclass=_LoadableMeta):
         for k, v in state.items():
             object.__setattr__(self, k, v)
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        # Frozen models made of immutable values only are safe to share
+        if _is_immutable_model(type(self)):
+            return self
+        cls = type(self)
+        clone = object.__new__(cls)
+        memo[id(self)] = clone
+        clone.__setstate__(deepcopy(self.__getstate__(), memo))
+        return clone
+
     def __eq__(self, other: Any) -> bool:
         if self is other:
             return True
@@ -499,17 +567,8 @@ class Loadable(metaclass=_LoadableMeta):
 
     def to_dict(self) -> dict[str, Any]:
         result = {}
-        for f in fields(self):
-            # Skip all private fields
-            if f.name.startswith("_"):
-                continue
-
-            # Skip dataclass fields with the 'exclude_from_dict' flag in metadata
-            if f.metadata.get(EXCLUDE_FIELD_META_KEY):
-                continue
-
-            value = getattr(self, f.name)
-            encoder = f.metadata.get('encoder')
+        for name, encoder in _to_dict_fields(type(self)):
+            value = getattr(self, name)
             value = encoder(value) if encoder else value
 
             # Recursively call to_dict if the field is a dataclass instance
@@ -523,5 +582,5 @@ class Loadable(metaclass=_LoadableMeta):
                     new_value[k] = v.to_dict() if is_dataclass(v) else v
                 value = new_value
 
-            result[f.name] = value
+            result[name] = value
         return result
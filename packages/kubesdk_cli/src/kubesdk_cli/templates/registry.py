@@ -45,8 +45,14 @@ def maybe_get_model_key(model_class: type[Any]) -> Optional[ModelKey]:
 def register_model(model_class: type[Any]) -> None:
     """Register a model class in the global registry, if it has a resolvable key."""
     model_key = maybe_get_model_key(model_class)
-    if model_key is not None:
-        ALL_RESOURCES.setdefault(model_key, model_class)
+    if model_key is None:
+        return
+    registered = ALL_RESOURCES.get(model_key)
+    # @dataclass(slots=True) rebuilds the class after the metaclass has already registered the original one,
+    # so the rebuilt class of the same definition replaces it. Other classes never override the registered model.
+    if registered is None or (registered.__module__, registered.__qualname__) == \
+            (model_class.__module__, model_class.__qualname__):
+        ALL_RESOURCES[model_key] = model_class
 
 
 def get_model(api_version: str, kind: str) -> type[Any] | None: